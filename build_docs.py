@@ -0,0 +1,12 @@
+"""
+Documentation Build Entry Point
+Builds every generate_*.py document in parallel (see docgen/build.py); same as `./docs build`
+"""
+
+import sys
+
+from docgen.build import main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
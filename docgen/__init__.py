@@ -0,0 +1,3 @@
+"""
+Shared build tooling for the generate_*.py documentation generators
+"""
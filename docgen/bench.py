@@ -0,0 +1,336 @@
+"""
+Documentation Benchmarks
+Runs the generators against synthetic inputs of increasing size and compares the results to a baseline
+
+    python -m docgen.bench                      # full matrix, writes bench_results.json
+    python -m docgen.bench --quick --only er    # smallest sizes of the ER cases
+    python -m docgen.bench --update-baseline    # accept the current numbers
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+from docgen.build import discover
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RESULTS_PATH = 'bench_results.json'
+BASELINE_PATH = 'docs_bench_baseline.json'
+
+SCHEMA_SIZES = (10, 100, 500)
+JEST_SIZES = (10, 1000, 50000)
+COVERAGE_SIZES = (1000, 5000)
+
+# Allowed growth over the baseline before a metric counts as a regression
+DEFAULT_THRESHOLDS = {
+    'wall_s': 0.20,
+    'graphviz_s': 0.25,
+    'build_s': 0.20,
+    'peak_rss_kb': 0.15,
+    'output_bytes': 0.10,
+}
+
+# Differences below these are noise, whatever the ratio
+MIN_DELTA = {
+    'wall_s': 0.05,
+    'graphviz_s': 0.05,
+    'build_s': 0.05,
+    'peak_rss_kb': 4096,
+    'output_bytes': 1024,
+}
+
+# One benchmark run: a generator module and the synthetic files it reads,
+# as {path relative to the repo root: function returning the file's text}
+Case = namedtuple('Case', 'name module fixtures')
+
+
+# Synthetic inputs
+
+def synthetic_schema(models, seed=0):
+    """A Prisma schema of `models` models in loosely linked domains around one hub model"""
+    rng = random.Random(seed)
+    names = ['Account'] + [f"Entity{i:04d}" for i in range(1, models)]
+    fields = {name: [
+        '  id        String   @id @default(uuid())',
+        '  name      String',
+        '  status    String   @default("active")',
+        '  createdAt DateTime @default(now())',
+    ] for name in names}
+
+    for i, child in enumerate(names[1:], start=1):
+        # Mostly neighbours within a domain of about eight models, plus the hub
+        domain_start = max(1, i - i % 8)
+        parents = {0} if rng.random() < 0.5 else set()
+        if i > domain_start:
+            parents.add(rng.randrange(domain_start, i))
+        if i > 8 and rng.random() < 0.2:
+            parents.add(rng.randrange(1, i))
+        for j in sorted(parents):
+            parent = names[j]
+            relation = f"{parent}_{child}"
+            fk = f"{parent[0].lower()}{parent[1:]}Id"
+            fields[child].append(f"  {fk} String")
+            fields[child].append(
+                f'  {parent[0].lower()}{parent[1:]} {parent} @relation("{relation}", fields: [{fk}], references: [id])')
+            fields[parent].append(f'  {child[0].lower()}{child[1:]}s {child}[] @relation("{relation}")')
+
+    blocks = ['datasource db {\n  provider = "postgresql"\n  url      = env("DATABASE_URL")\n}']
+    for name in names:
+        blocks.append(f"model {name} {{\n" + '\n'.join(fields[name]) + '\n}')
+    return '\n\n'.join(blocks) + '\n'
+
+
+def synthetic_jest_output(tests, seed=0):
+    """Console output of a `jest --coverage` run with `tests` tests, about 20 per suite"""
+    rng = random.Random(seed)
+    lines = ['> project-toci-hajdari-cela@0.1.0 test', '> jest --coverage', '']
+    failed = 0
+    suites = max(1, tests // 20)
+    for s in range(suites):
+        count = tests // suites + (1 if s < tests % suites else 0)
+        results = [rng.random() > 0.01 for _ in range(count)]
+        failed += results.count(False)
+        lines.append(f"{'PASS' if all(results) else 'FAIL'} src/__tests__/Module{s:05d}.test.ts")
+        lines.append(f"  Module{s:05d}")
+        for t, passed in enumerate(results):
+            if t % 5 == 0:
+                lines.append(f"    method{t // 5}")
+            mark = '√' if passed else '×'
+            lines.append(f"      {mark} should handle case {t} correctly ({rng.randint(1, 40)} ms)")
+        lines.append('')
+    lines += [
+        f"Test Suites: {suites} total",
+        f"Tests:       {failed} failed, {tests - failed} passed, {tests} total" if failed
+        else f"Tests:       {tests} passed, {tests} total",
+        'Snapshots:   0 total',
+        f"Time:        {tests * 0.004:.3f} s",
+        'Ran all test suites.',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def synthetic_coverage_summary(files, seed=0):
+    """An Istanbul coverage-summary.json for `files` source files"""
+    rng = random.Random(seed)
+    metrics = ('lines', 'statements', 'functions', 'branches')
+    totals = {m: [0, 0] for m in metrics}
+    report = {}
+    for i in range(files):
+        entry = {}
+        for m in metrics:
+            total = rng.randint(5, 400)
+            covered = int(total * rng.random() ** 0.5)
+            totals[m][0] += total
+            totals[m][1] += covered
+            entry[m] = {'total': total, 'covered': covered, 'skipped': 0,
+                        'pct': round(100 * covered / total, 2)}
+        report[f"/app/src/module{i // 50:03d}/File{i:05d}.ts"] = entry
+    report = {'total': {m: {'total': t, 'covered': c, 'skipped': 0, 'pct': round(100 * c / t, 2) if t else 100}
+                        for m, (t, c) in totals.items()}, **report}
+    return json.dumps(report)
+
+
+def cases():
+    """The benchmark matrix, smallest size of each family first"""
+    result = []
+    for n in SCHEMA_SIZES:
+        schema = {'prisma/schema.prisma': lambda n=n: synthetic_schema(n)}
+        result.append(Case(f"er_diagram/{n}_models", 'generate_er_diagram', schema))
+        result.append(Case(f"er_presentation/{n}_models", 'generate_er_diagram_presentation', schema))
+    for n in JEST_SIZES:
+        jest = {'test_output.txt': lambda n=n: synthetic_jest_output(n)}
+        result.append(Case(f"testing/{n}_tests", 'generate_testing_pdf', jest))
+        result.append(Case(f"tests_documentation/{n}_tests", 'generate_tests_documentation', jest))
+    for n in COVERAGE_SIZES:
+        coverage = {'coverage/coverage-summary.json': lambda n=n: synthetic_coverage_summary(n)}
+        result.append(Case(f"testing/{n}_coverage_files", 'generate_testing_pdf', coverage))
+    for module in ('generate_architecture_pdf', 'generate_diagrams_presentation', 'generate_design_patterns_pdf'):
+        result.append(Case(module[len('generate_'):], module, {}))
+    return result
+
+
+# Running
+
+def _workspace(case, directory, outputs):
+    """Link the repo into `directory`, replacing the case's inputs with synthetic ones"""
+    overridden = {path.split('/')[0] for path in case.fixtures}
+    for entry in os.listdir(ROOT):
+        # Outputs are left out so the generators never write through a link into the repo
+        if entry.startswith('.') or entry in overridden or entry in outputs:
+            continue
+        os.symlink(os.path.join(ROOT, entry), os.path.join(directory, entry))
+    # Keep the untouched siblings of an overridden directory (e.g. prisma/migrations)
+    for top in overridden:
+        source = os.path.join(ROOT, top)
+        if os.path.isdir(source):
+            shutil.copytree(source, os.path.join(directory, top))
+    for path, make in case.fixtures.items():
+        target = os.path.join(directory, path)
+        os.makedirs(os.path.dirname(target) or directory, exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(make())
+
+
+def run_case(case, targets):
+    """Run one case in a fresh process and scratch directory, returning its metrics"""
+    target = targets[case.module]
+    with tempfile.TemporaryDirectory(prefix='docs-bench-') as directory:
+        _workspace(case, directory, {t.output for t in targets.values()})
+        env = dict(os.environ,
+                   PYTHONPATH=os.pathsep.join(filter(None, [ROOT, os.environ.get('PYTHONPATH')])),
+                   DOCS_CACHE_DIR=os.path.join(directory, '.docs_cache'),
+                   DOCS_OUTPUT_DIR=directory, DOCS_SCRATCH_DIR='')
+        proc = subprocess.run(
+            [sys.executable, '-m', 'docgen.bench', '--child', target.module, target.function],
+            cwd=directory, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"{case.name} failed:\n{proc.stderr.strip()}")
+        metrics = json.loads(proc.stdout.strip().splitlines()[-1])
+        output = os.path.join(directory, target.output) if target.output else None
+        metrics['output_bytes'] = os.path.getsize(output) if output and os.path.exists(output) else 0
+    return metrics
+
+
+def _child(module, function):
+    """Benchmark body, run inside the scratch directory; prints one JSON line"""
+    import importlib
+    import resource
+    from reportlab.platypus import SimpleDocTemplate
+    from docgen import render
+
+    spent = {'graphviz_s': 0.0, 'build_s': 0.0}
+
+    def timed(key, fn):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                spent[key] += time.perf_counter() - start
+        return wrapper
+
+    # Diagram threads can overlap, so graphviz_s is the summed layout time
+    render.layout = timed('graphviz_s', render.layout)
+    SimpleDocTemplate.build = timed('build_s', SimpleDocTemplate.build)
+
+    start = time.perf_counter()
+    getattr(importlib.import_module(module), function)()
+    wall = time.perf_counter() - start
+
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        usage //= 1024
+    print(json.dumps(dict(spent, wall_s=wall, peak_rss_kb=usage)))
+
+
+def run(selected, repeat=1):
+    """Benchmark each case, keeping the fastest of `repeat` runs"""
+    targets = {t.module: t for t in discover(ROOT)}
+    results = {}
+    for case in selected:
+        runs = [run_case(case, targets) for _ in range(repeat)]
+        best = min(runs, key=lambda m: m['wall_s'])
+        results[case.name] = best
+        print(f"  {best['wall_s']:8.2f}s  {case.name}  "
+              f"(graphviz {best['graphviz_s']:.2f}s, build {best['build_s']:.2f}s, "
+              f"{best['peak_rss_kb'] // 1024} MB, {best['output_bytes'] // 1024} KB)")
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cases': results,
+    }
+
+
+def compare(results, baseline, thresholds=None):
+    """List the metrics that grew past their threshold relative to the baseline"""
+    thresholds = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+    regressions = []
+    for name, metrics in results['cases'].items():
+        before = baseline.get('cases', {}).get(name)
+        if before is None:
+            continue
+        for metric, limit in thresholds.items():
+            old, new = before.get(metric), metrics.get(metric)
+            if old is None or new is None or new - old <= MIN_DELTA.get(metric, 0):
+                continue
+            if old == 0 or new > old * (1 + limit):
+                growth = f"+{(new / old - 1) * 100:.0f}%" if old else 'new'
+                regressions.append(f"{name}: {metric} {old:g} -> {new:g} ({growth}, limit +{limit * 100:.0f}%)")
+    return regressions
+
+
+def _threshold(text):
+    metric, _, value = text.partition('=')
+    if metric not in DEFAULT_THRESHOLDS or not value:
+        raise argparse.ArgumentTypeError(
+            f"expected METRIC=FRACTION with METRIC one of {', '.join(DEFAULT_THRESHOLDS)}")
+    return metric, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the documentation generators')
+    parser.add_argument('--only', action='append', default=[], metavar='TEXT',
+                        help='run only cases whose name contains TEXT (repeatable)')
+    parser.add_argument('--quick', action='store_true',
+                        help='run only the smallest size of each case family')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='runs per case; the fastest is kept (default: 1)')
+    parser.add_argument('-o', '--output', default=RESULTS_PATH,
+                        help=f'where to write the results (default: {RESULTS_PATH})')
+    parser.add_argument('--baseline', default=BASELINE_PATH,
+                        help=f'baseline to compare against (default: {BASELINE_PATH})')
+    parser.add_argument('--threshold', type=_threshold, action='append', default=[],
+                        metavar='METRIC=FRACTION', help='override a regression threshold, e.g. wall_s=0.3')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='store these results as the new baseline')
+    parser.add_argument('--child', nargs=2, metavar=('MODULE', 'FUNCTION'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(*args.child)
+        return 0
+
+    selected = cases()
+    if args.quick:
+        smallest = {}
+        for case in selected:
+            smallest.setdefault(re.sub(r'\d+', 'N', case.name), case)
+        selected = list(smallest.values())
+    if args.only:
+        selected = [c for c in selected if any(text in c.name for text in args.only)]
+
+    results = run(selected, repeat=args.repeat)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.update_baseline:
+        shutil.copyfile(args.output, args.baseline)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, dict(args.threshold))
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    print(f"{len(regressions)} regression(s) against {args.baseline}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""
+Documentation Build Driver
+Runs every generate_*.py generator as one dependency graph on a process pool
+
+Only the standard library is imported up front, so `docs list` and
+`docs build --dry-run` never load reportlab or graphviz; the workers do.
+"""
+
+import argparse
+import ast
+import glob
+import importlib
+import os
+import shutil
+import sys
+import time
+from collections import namedtuple
+
+from docgen import manifest, output, phases
+
+# Entry points looked up in each generator, in order of preference
+TARGET_FUNCTIONS = ('create_pdf', 'create_er_diagram')
+
+# A generator's final document, plus the diagram renders it can take pre-made.
+# `diagrams` is a list of (keyword argument, node) pairs, where a node is a
+# (module, function, kwargs) call; `output` and `inputs` come from the
+# generator's OUTPUT and INPUTS declarations, plus the source files of its
+# 'code' blocks (docgen/document.py).
+Target = namedtuple('Target', 'module function diagrams output inputs')
+
+# Renders a registry entry from a generator's DIAGRAMS declaration
+REGISTRY_NODE = ('docgen.diagrams', 'render')
+
+
+def _is_diagram_function(name):
+    return name.startswith('create_') and name.endswith('_diagram')
+
+
+def _is_submit(func):
+    """`submit(...)` or `render.submit(...)` (see docgen/render.py)"""
+    name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+    return name == 'submit'
+
+
+def discover(root='.'):
+    """Find every generator target without importing reportlab or graphviz"""
+    targets = []
+    for path in sorted(glob.glob(os.path.join(root, 'generate_*.py'))):
+        module = os.path.splitext(os.path.basename(path))[0]
+        with open(path, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+
+        functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+        function = next((name for name in TARGET_FUNCTIONS if name in functions), None)
+        if function is None:
+            continue
+
+        # A diagram can run as its own node when the target assigns its result
+        # to a parameter, e.g. `arch_diagram = create_architecture_diagram()`,
+        # or the Future of it, `arch_diagram = submit(create_architecture_diagram)`
+        target_def = functions[function]
+        params = {arg.arg for arg in target_def.args.args}
+        diagrams = []
+        for node in ast.walk(target_def):
+            if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)):
+                continue
+            call = node.value.func
+            if _is_submit(call) and node.value.args:
+                call = node.value.args[0]
+            if not (isinstance(call, ast.Name) and call.id in functions and call.id != function):
+                continue
+            if not _is_diagram_function(call.id):
+                continue
+            for name in node.targets:
+                if isinstance(name, ast.Name) and name.id in params:
+                    diagrams.append((name.id, (module, call.id, ())))
+
+        output, inputs, registry = _declarations(tree)
+        # Registry entries are shared: documents declaring the same one get the same node
+        for param, (name, variant) in registry.items():
+            if param in params:
+                diagrams.append((param, REGISTRY_NODE + ((('name', name), ('variant', variant)),)))
+        # The script itself and the docgen modules it imports are always inputs
+        inputs = [os.path.relpath(path, root)] + inputs + _code_paths(tree) + _docgen_imports(tree)
+        targets.append(Target(module, function, diagrams, output, inputs))
+    return targets
+
+
+def _declarations(tree):
+    """Read the module-level OUTPUT, INPUTS and DIAGRAMS literals"""
+    values = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            if node.targets[0].id in ('OUTPUT', 'INPUTS', 'DIAGRAMS'):
+                values[node.targets[0].id] = ast.literal_eval(node.value)
+    return values.get('OUTPUT'), list(values.get('INPUTS', [])), dict(values.get('DIAGRAMS', {}))
+
+
+def _code_paths(tree):
+    """Source files shown by 'code' blocks, e.g. ('code', 'src/lib/prisma.ts') or ('code', AUTH_TESTS, ...)
+
+    The path may be a string or the name of a module-level string constant.
+    """
+    constants = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)):
+            constants[node.targets[0].id] = node.value.value
+    paths = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.Tuple) and len(node.elts) >= 2):
+            continue
+        kind, path = node.elts[:2]
+        if not (isinstance(kind, ast.Constant) and kind.value == 'code'):
+            continue
+        if isinstance(path, ast.Constant) and isinstance(path.value, str):
+            path = path.value
+        elif isinstance(path, ast.Name) and path.id in constants:
+            path = constants[path.id]
+        else:
+            continue
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+def declared_output(path):
+    """The OUTPUT a module declares, read like discover() reads it, without importing the module"""
+    with open(path, encoding='utf-8') as f:
+        return _declarations(ast.parse(f.read(), filename=path))[0]
+
+
+def _direct_docgen_imports(tree):
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith('docgen'):
+            modules.add(node.module)
+            modules.update(f"{node.module}.{alias.name}" for alias in node.names)
+    paths = [m.replace('.', os.sep) + '.py' for m in sorted(modules)]
+    return [p for p in paths if os.path.exists(p)]
+
+
+# path -> (mtime_ns, docgen modules it imports directly), shared by discover() calls
+_import_cache = {}
+
+
+def _docgen_imports(tree):
+    """The docgen modules a generator imports, directly or through other docgen modules"""
+    found = set()
+    pending = _direct_docgen_imports(tree)
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.add(path)
+        mtime = os.stat(path).st_mtime_ns
+        cached = _import_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, encoding='utf-8') as f:
+                cached = (mtime, _direct_docgen_imports(ast.parse(f.read(), filename=path)))
+            _import_cache[path] = cached
+        pending.extend(cached[1])
+    return sorted(found)
+
+
+def stale_targets(targets):
+    """Split targets into (stale, fresh) using the manifests next to their outputs
+
+    Returns the stale targets together with the input snapshot to save once
+    each one builds successfully.
+    """
+    stale, fresh, snapshots = [], [], {}
+    for target in targets:
+        if target.output is None:
+            stale.append(target)
+            continue
+        published = output.path(target.output)
+        previous = manifest.load(published)
+        state = manifest.snapshot(target.inputs, previous)
+        if manifest.is_stale(published, state, previous):
+            stale.append(target)
+            snapshots[target.module] = state
+        else:
+            fresh.append(target)
+            if state != previous:
+                # Same content with new mtimes; refresh so the next check skips hashing
+                manifest.save(published, state)
+    return stale, fresh, snapshots
+
+
+def record(target, state):
+    """Save the input manifest of a target that built successfully
+
+    Drafts remove it instead, so the next full build replaces the draft.
+    """
+    from docgen import draft
+    published = output.path(target.output)
+    if draft.enabled():
+        manifest.remove(published)
+    else:
+        manifest.save(published, state)
+
+
+def run_node(module, function, kwargs=None):
+    """Import a generator and call one of its functions (runs in a worker process)
+
+    Returns the result, the elapsed time and the phase timings recorded while
+    profiling (empty otherwise).
+    """
+    start = time.perf_counter()
+    result = getattr(importlib.import_module(module), function)(**(kwargs or {}))
+    return result, time.perf_counter() - start, phases.drain()
+
+
+def node_name(node):
+    """'generate_x.create_y_diagram' or 'docgen.diagrams.render(architecture, compact)'"""
+    module, function, kwargs = node
+    if not kwargs:
+        return f"{module}.{function}"
+    return f"{module}.{function}({', '.join(str(value) for _, value in kwargs)})"
+
+
+def build(targets, jobs=None):
+    """Run diagram nodes first, then each PDF as soon as its diagrams are ready
+
+    A diagram node declared by several documents runs once and its result is
+    handed to all of them. Returns per-node timings and the set of generator
+    modules that failed.
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+    failed = set()
+    timings = {}
+    rendered = {t.module: {} for t in targets}
+    waiting = {t.module: t for t in targets if t.diagrams}
+    consumers = {}
+    for target in targets:
+        for param, node in target.diagrams:
+            consumers.setdefault(node, []).append((target.module, param))
+    pending = {}
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Diagram renders go in the queue ahead of every PDF assembly
+        for node in consumers:
+            module, function, kwargs = node
+            pending[pool.submit(run_node, module, function, dict(kwargs))] = node
+        for target in targets:
+            if not target.diagrams:
+                future = pool.submit(run_node, target.module, target.function)
+                pending[future] = (target.module, target.function, ())
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = pending.pop(future)
+                name = node_name(node)
+                documents = [module for module, _ in consumers.get(node, [(node[0], None)])]
+                try:
+                    result, elapsed, records = future.result()
+                except Exception as e:
+                    print(f"FAILED {name}: {e}", file=sys.stderr)
+                    for module in documents:
+                        failed.add(module)
+                        waiting.pop(module, None)
+                    continue
+
+                timings[name] = elapsed
+                phases.absorb(records)
+
+                for module, param in consumers.get(node, ()):
+                    target = waiting.get(module)
+                    if target is None:
+                        continue
+                    rendered[module][param] = result
+                    if len(rendered[module]) == len(target.diagrams):
+                        del waiting[module]
+                        future = pool.submit(run_node, module, target.function, rendered[module])
+                        pending[future] = (module, target.function, ())
+
+    return timings, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build all documentation PDFs')
+    parser.add_argument('generators', nargs='*',
+                        help='generator modules to build (default: all generate_*.py)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(),
+                        help='number of worker processes (default: CPU count)')
+    parser.add_argument('-f', '--force', action='store_true',
+                        help='rebuild even when the input manifest is unchanged')
+    parser.add_argument('--raster', action='store_true',
+                        help='embed diagrams as PNG rasters instead of vector drawings')
+    parser.add_argument('--layout-budget', type=float, metavar='SECONDS',
+                        help='time allowed per Graphviz layout before a cheaper fallback is tried (0: no limit)')
+    parser.add_argument('--graphviz-backend', choices=('auto', 'library', 'subprocess'),
+                        help='lay out diagrams in process through libgvc, with the Graphviz binaries, '
+                             'or (auto) in process when installed for layouts the budget need not guard '
+                             '(default: DOCS_GRAPHVIZ_BACKEND or auto)')
+    parser.add_argument('--profile', nargs='?', const='times', metavar='EXTRAS',
+                        help="time each generator phase; EXTRAS may add 'cprofile' and/or 'tracemalloc', "
+                             "e.g. --profile=cprofile,tracemalloc")
+    parser.add_argument('-o', '--output-dir', metavar='DIR',
+                        help='directory the documents are published to (default: DOCS_OUTPUT_DIR or .)')
+    parser.add_argument('--draft', action='store_true',
+                        help='fast preview: diagrams as placeholders sized like their last render, '
+                             'no Graphviz layout, no page compression')
+    parser.add_argument('--handbook', action='store_true',
+                        help='also build handbook.pdf, one bookmarked PDF holding every document')
+    parser.add_argument('-n', '--dry-run', action='store_true',
+                        help='list the documents that would be built and the diagrams they need, then stop')
+    parser.add_argument('-w', '--watch', action='store_true',
+                        help='keep running and rebuild the documents affected by each change (Linux inotify)')
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        extras = set(args.profile.split(','))
+        phases.enable(cprofile='cprofile' in extras, tracemalloc_snapshots='tracemalloc' in extras)
+    if args.layout_budget is not None:
+        os.environ['DOCS_LAYOUT_BUDGET'] = str(args.layout_budget)
+    if args.graphviz_backend:
+        os.environ['DOCS_GRAPHVIZ_BACKEND'] = args.graphviz_backend
+    if args.output_dir:
+        os.environ['DOCS_OUTPUT_DIR'] = args.output_dir
+    if args.raster:
+        # Inherited by the worker processes
+        os.environ['DOCS_DIAGRAM_MODE'] = 'raster'
+    if args.draft:
+        os.environ['DOCS_DRAFT'] = '1'
+
+    targets = discover()
+    wanted = None
+    if args.generators:
+        wanted = {os.path.splitext(g)[0] for g in args.generators}
+        targets = [t for t in targets if t.module in wanted]
+    if args.handbook:
+        from docgen import handbook
+        targets.append(handbook.target(discover()))
+
+    if not (args.dry_run or args.draft):
+        # Once here rather than in every worker; workers inherit the PATH it may extend
+        from docgen import toolchain
+        try:
+            toolchain.dot_path()
+        except toolchain.GraphvizNotFound as e:
+            print(e, file=sys.stderr)
+            return 1
+
+    if args.watch:
+        from docgen import watch
+        return watch.run(targets, wanted)
+
+    start = time.perf_counter()
+    if args.force:
+        snapshots = {t.module: manifest.snapshot(t.inputs) for t in targets if t.output}
+    else:
+        targets, fresh, snapshots = stale_targets(targets)
+        for target in fresh:
+            print(f"  up to date  {target.output}")
+
+    if args.dry_run:
+        nodes = {node for target in targets for _, node in target.diagrams}
+        for node in sorted(nodes):
+            print(f"  would render  {node_name(node)}")
+        for target in targets:
+            print(f"  would build   {target.output or node_name((target.module, target.function, ()))}")
+        return 0
+
+    # Intermediate files of this build stay out of the way of concurrent builds
+    scratch = output.new_scratch_dir()
+    try:
+        timings, failed = build(targets, jobs=args.jobs)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    for target in targets:
+        if target.module not in failed and target.module in snapshots:
+            record(target, snapshots[target.module])
+
+    for name, elapsed in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {elapsed:7.2f}s  {name}")
+    print(f"Built {len(targets) - len(failed)}/{len(targets)} documents "
+          f"in {time.perf_counter() - start:.2f}s with {args.jobs} jobs")
+
+    if args.profile:
+        report = phases.report(phases.drain())
+        print(phases.summary_table(report))
+        print(f"Profile written to {phases.write_report(report)}")
+    return 1 if failed else 0
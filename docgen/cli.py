@@ -0,0 +1,138 @@
+"""
+Documentation Command Line
+One entry point for the documentation tooling; each command imports only what it needs, so
+`docs list` and `docs build --dry-run` start without loading reportlab or graphviz
+
+    ./docs list                 # documents, their diagrams and whether they are up to date
+    ./docs build [-f] [-j N]    # build (see `docs build --help`; build_docs.py is the same)
+    ./docs watch                # rebuild on every change
+    ./docs bench --quick        # benchmarks (see docgen/bench.py)
+    ./docs clean [--cache]      # remove built documents, manifests and optionally caches
+    ./docs check                # Graphviz and Python packages the build needs
+"""
+
+import argparse
+import importlib
+import importlib.util
+import os
+import shutil
+import sys
+
+from docgen import build, manifest, output
+
+CACHE_DIR = os.environ.get('DOCS_CACHE_DIR', '.docs_cache')
+
+# Python packages the generators import, and whether the build works without them
+PACKAGES = [('reportlab', True), ('graphviz', True), ('PIL', True), ('svglib', False)]
+
+
+def list_documents(argv):
+    parser = argparse.ArgumentParser(prog='docs list', description='List the documents and their state')
+    parser.parse_args(argv)
+    for target in build.discover():
+        if target.output is None:
+            state = 'always'
+        else:
+            published = output.path(target.output)
+            previous = manifest.load(published)
+            stale = manifest.is_stale(published, manifest.snapshot(target.inputs, previous), previous)
+            state = 'stale' if stale else 'up to date'
+        diagrams = ', '.join(param for param, _ in target.diagrams)
+        print(f"  {state:<10}  {target.output or '-':<32}  {target.module}"
+              + (f"  [{diagrams}]" if diagrams else ''))
+    return 0
+
+
+def clean(argv):
+    parser = argparse.ArgumentParser(prog='docs clean', description='Remove built documents and their manifests')
+    parser.add_argument('--cache', action='store_true',
+                        help=f'also remove the render, image and font caches ({CACHE_DIR})')
+    args = parser.parse_args(argv)
+
+    # Read from the source; importing docgen/handbook.py would load reportlab
+    handbook = build.declared_output(os.path.join(os.path.dirname(__file__), 'handbook.py'))
+    outputs = [t.output for t in build.discover() if t.output] + [handbook]
+    for name in outputs:
+        published = output.path(name)
+        for path in (published, manifest.manifest_path(published)):
+            if os.path.exists(path):
+                os.remove(path)
+                print(f"  removed  {path}")
+    if args.cache and os.path.isdir(CACHE_DIR):
+        shutil.rmtree(CACHE_DIR)
+        print(f"  removed  {CACHE_DIR}/")
+    return 0
+
+
+def check(argv):
+    parser = argparse.ArgumentParser(prog='docs check', description='Check for the tools the build needs')
+    parser.parse_args(argv)
+    import subprocess
+    from docgen import toolchain
+
+    ok = True
+    try:
+        dot = toolchain.dot_path()
+        version = subprocess.run([dot, '-V'], capture_output=True, text=True).stderr.strip()
+        print(f"  ok       {version} ({dot})")
+    except toolchain.GraphvizNotFound as e:
+        ok = False
+        print(f"  missing  {e}")
+    else:
+        # Layouts only run in process when libgvc matches `dot` (see docgen/render.py)
+        from docgen import libgvc
+        library = libgvc.version()
+        if library is None:
+            print("  missing  libgvc (optional; layouts run as dot processes)")
+        elif library in version.split():
+            print(f"  ok       libgvc {library} (matches dot)")
+        else:
+            print(f"  missing  libgvc matching dot (found {library}; optional, layouts run as dot processes)")
+    for package, required in PACKAGES:
+        if importlib.util.find_spec(package):
+            print(f"  ok       {package}")
+        else:
+            ok = ok and not required
+            print(f"  missing  {package}" + ('' if required else ' (optional)'))
+    return 0 if ok else 1
+
+
+def _build_with(*flags):
+    def run(argv):
+        return build.main([*flags, *argv])
+    return run
+
+
+def _bench(argv):
+    return importlib.import_module('docgen.bench').main(argv)
+
+
+# name -> (handler taking the remaining arguments, one-line help)
+COMMANDS = {
+    'list': (list_documents, 'list the documents, their diagrams and whether they are up to date'),
+    'build': (build.main, 'build the stale documents (-f for all; --help for every option)'),
+    'watch': (_build_with('--watch'), 'rebuild the documents affected by each change'),
+    'draft': (_build_with('--draft'), 'fast preview build with placeholder diagrams'),
+    'bench': (_bench, 'run the benchmarks and compare them to the baseline'),
+    'clean': (clean, 'remove the built documents and their manifests (--cache: caches too)'),
+    'check': (check, 'check for Graphviz and the Python packages the build needs'),
+}
+
+
+def usage():
+    width = max(len(name) for name in COMMANDS)
+    lines = ['usage: docs <command> [options]', '', 'commands:']
+    lines += [f"  {name:<{width}}  {text}" for name, (_, text) in COMMANDS.items()]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ('-h', '--help'):
+        print(usage())
+        return 0 if argv else 2
+    command = COMMANDS.get(argv[0])
+    if command is None:
+        print(f"docs: unknown command '{argv[0]}'\n\n{usage()}", file=sys.stderr)
+        return 2
+    return command[0](argv[1:])
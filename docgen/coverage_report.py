@@ -0,0 +1,251 @@
+"""
+Coverage Report Ingestion
+Streams coverage-summary.json, lcov.info or Jest's text table and aggregates it by directory,
+keeping only the worst-covered files of each directory in memory
+"""
+
+import heapq
+import os
+import re
+from collections import namedtuple
+
+from reportlab.lib import colors
+from reportlab.platypus import Table, TableStyle
+
+from docgen import fonts
+from docgen.json_stream import iter_object
+
+# Most detailed source first; test_output.txt holds the `text` reporter's table
+COVERAGE_PATHS = ('coverage/coverage-summary.json', 'coverage/lcov.info', 'test_output.txt')
+
+METRICS = ('statements', 'branches', 'functions', 'lines')
+
+# Files listed for each directory, lowest line coverage first
+WORST_FILES = 5
+
+# `counts` maps a metric to (covered, total); lcov has no statement counts
+FileCoverage = namedtuple('FileCoverage', 'path counts')
+Directory = namedtuple('Directory', 'name files counts worst')
+Report = namedtuple('Report', 'source totals directories worst')
+
+_LCOV_KEYS = {'LF': ('lines', 1), 'LH': ('lines', 0), 'FNF': ('functions', 1), 'FNH': ('functions', 0),
+              'BRF': ('branches', 1), 'BRH': ('branches', 0)}
+_TEXT_ROW_RE = re.compile(r'^(\s*)([^|]*?)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)\s*\|')
+_TEXT_SUMMARY_RE = re.compile(r'^(Statements|Branches|Functions|Lines)\s*:\s*[\d.]+%\s*\(\s*(\d+)/(\d+)\s*\)')
+
+
+class CoverageNotFound(FileNotFoundError):
+    pass
+
+
+def coverage_path():
+    """The first coverage report that exists; raises CoverageNotFound when there is none"""
+    path = next((p for p in COVERAGE_PATHS if os.path.exists(p)), None)
+    if path is None:
+        raise CoverageNotFound(f"no coverage report in {os.getcwd()}: expected {' or '.join(COVERAGE_PATHS[:-1])}; "
+                               "run `npm run test:coverage` first")
+    return path
+
+
+def pct(counts, metric):
+    covered, total = counts.get(metric, (0, 0))
+    return 100.0 if not total else 100.0 * covered / total
+
+
+def _relative(path):
+    path = path.replace('\\', '/')
+    cwd = os.getcwd().replace('\\', '/') + '/'
+    return path[len(cwd):] if path.startswith(cwd) else path
+
+
+def iter_files(path, totals=None):
+    """Yield a FileCoverage per source file, filling `totals` when the report has them"""
+    totals = {} if totals is None else totals
+    if path.endswith('.json'):
+        return _iter_summary_json(path, totals)
+    if path.endswith('.info'):
+        return _iter_lcov(path)
+    return _iter_text(path, totals)
+
+
+def _iter_summary_json(path, totals):
+    with open(path, encoding='utf-8') as f:
+        for key, entry in iter_object(f):
+            counts = {m: (entry[m]['covered'], entry[m]['total']) for m in METRICS if m in entry}
+            if key == 'total':
+                totals.update(counts)
+            else:
+                yield FileCoverage(_relative(key), counts)
+
+
+def _iter_lcov(path):
+    source, counts = None, {}
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('SF:'):
+                source, counts = _relative(line[3:].strip()), {}
+            elif line.startswith('end_of_record'):
+                if source is not None:
+                    yield FileCoverage(source, {m: tuple(c) for m, c in counts.items()})
+                source = None
+            else:
+                key, _, value = line.partition(':')
+                if key in _LCOV_KEYS and value.strip().isdigit():
+                    metric, index = _LCOV_KEYS[key]
+                    counts.setdefault(metric, [0, 0])[index] = int(value)
+
+
+def _iter_text(path, totals):
+    """Jest's `text` reporter only prints percentages, so each file counts as (pct, 100)
+
+    The directory rows' own percentages go to totals['directories'].
+    """
+    in_table = False
+    dirs = []  # (indent, name) of the enclosing directory rows
+    pending = None  # the previous row; a directory if the next row is indented deeper
+
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not in_table:
+                in_table = '% Stmts' in line
+                match = _TEXT_SUMMARY_RE.match(line)
+                if match:
+                    totals[match.group(1).lower()] = (int(match.group(2)), int(match.group(3)))
+                continue
+            match = _TEXT_ROW_RE.match(line)
+            if not match:
+                if not line.startswith('-'):
+                    in_table = False
+                continue
+            indent, name = len(match.group(1)), match.group(2)
+            if name == 'All files':
+                continue
+            if pending is not None:
+                if indent > pending[0]:
+                    dirs.append((pending[0], pending[1].path))
+                    totals.setdefault('directories', {})[pending[1].path] = pending[1].counts
+                else:
+                    yield pending[1]
+            while dirs and dirs[-1][0] >= indent:
+                dirs.pop()
+            parent = dirs[-1][1] if dirs else ''
+            counts = {m: (float(v), 100) for m, v in zip(METRICS, match.groups()[2:])}
+            pending = (indent, FileCoverage(f"{parent}/{name}" if parent else name, counts))
+    if pending is not None:
+        yield pending[1]
+
+
+def _add(counts, other):
+    for metric, (covered, total) in other.items():
+        c, t = counts.get(metric, (0, 0))
+        counts[metric] = (c + covered, t + total)
+
+
+def _keep_worst(heap, item, size, seq):
+    # Min-heap on negated line coverage holding the `size` lowest; ties keep the earlier file
+    entry = (-pct(item.counts, 'lines'), -seq, item)
+    if len(heap) < size:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+def _lowest(heap):
+    return [item for _, _, item in sorted(heap, key=lambda e: (-e[0], -e[1]))]
+
+
+def read_coverage(path=None, worst=WORST_FILES):
+    """Aggregate a coverage report by directory in one pass
+
+    Memory grows with the number of directories, not files: each directory
+    keeps its summed counts and its `worst` lowest-covered files.
+    """
+    path = path or coverage_path()
+    totals = {}
+    summed = {}
+    by_dir = {}
+    overall = []
+    for seq, item in enumerate(iter_files(path, totals)):
+        directory = os.path.dirname(item.path)
+        entry = by_dir.setdefault(directory, [0, {}, []])
+        entry[0] += 1
+        _add(entry[1], item.counts)
+        _keep_worst(entry[2], item, worst, seq)
+        _keep_worst(overall, item, worst, seq)
+        _add(summed, item.counts)
+
+    # Percent-only reports carry each directory's real figures
+    listed = totals.pop('directories', {})
+    for name, counts in listed.items():
+        if name in by_dir:
+            by_dir[name][1] = counts
+
+    # Drop the prefix every directory shares (e.g. /app/src from the CI container)
+    names = list(by_dir)
+    common = os.path.commonpath(names) if len(names) > 1 and all(names) else ''
+    directories = []
+    for name, (files, counts, heap) in by_dir.items():
+        short = name[len(common):].lstrip('/') if common else name
+        directories.append(Directory(short or name or '.', files, counts, _lowest(heap)))
+    directories.sort(key=lambda d: (pct(d.counts, 'lines'), d.name))
+    return Report(path, totals or summed, directories, _lowest(overall))
+
+
+def _shade(value):
+    if value >= 80:
+        return colors.HexColor('#C8E6C9')
+    if value >= 50:
+        return colors.HexColor('#FFF9C4')
+    return colors.HexColor('#FFCDD2')
+
+
+def _cells(counts):
+    return [f"{pct(counts, m):.2f}%" if m in counts else '-' for m in METRICS]
+
+
+def _coverage_table(rows, col_widths, metric_rows, header_color='#1976D2'):
+    """Table with the four metric columns shaded by how well they are covered"""
+    fonts.register()
+    style = [
+        ('FONTNAME', (0, 0), (-1, 0), fonts.SANS_BOLD),
+        ('FONTNAME', (0, 1), (-1, -1), fonts.SANS),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDBDBD')),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+        ('PADDING', (0, 0), (-1, -1), 5),
+    ]
+    first = len(rows[0]) - len(METRICS)
+    for row, counts in metric_rows:
+        for col, metric in enumerate(METRICS, start=first):
+            if metric in counts:
+                style.append(('BACKGROUND', (col, row), (col, row), _shade(pct(counts, metric))))
+    table = Table(rows, colWidths=col_widths, repeatRows=1)
+    table.setStyle(TableStyle(style))
+    return table
+
+
+def directory_coverage_table(report, header, col_widths, total_label='Total'):
+    """One row per directory (name, files, four metrics), worst first, then the totals"""
+    rows = [header]
+    metric_rows = []
+    for d in report.directories:
+        metric_rows.append((len(rows), d.counts))
+        rows.append([d.name, str(d.files)] + _cells(d.counts))
+    metric_rows.append((len(rows), report.totals))
+    rows.append([total_label, str(sum(d.files for d in report.directories))] + _cells(report.totals))
+    table = _coverage_table(rows, col_widths, metric_rows)
+    table.setStyle(TableStyle([('FONTNAME', (0, -1), (-1, -1), fonts.SANS_BOLD)]))
+    return table
+
+
+def file_coverage_table(files, header, col_widths):
+    """The given files (e.g. a directory's `worst`) with their four metrics"""
+    rows = [header]
+    metric_rows = []
+    for item in files:
+        metric_rows.append((len(rows), item.counts))
+        rows.append([os.path.basename(item.path)] + _cells(item.counts))
+    return _coverage_table(rows, col_widths, metric_rows, header_color='#424242')
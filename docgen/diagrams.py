@@ -0,0 +1,320 @@
+"""
+Diagram Registry
+Named diagrams with variants ('compact' for the reference documents, 'presentation' for
+slides) that every document pulls from, so each (diagram, variant) is laid out once per build
+
+    from docgen import diagrams
+    arch_diagram = diagrams.render('architecture', 'compact')
+    git_diagram = diagrams.submit('git_workflow', 'compact')   # a Future, rendered on a thread
+
+Generators list the entries they embed in a DIAGRAMS literal mapping a create_pdf
+parameter to (diagram, variant); docgen/build.py renders each entry once and hands
+the result to every document that declared it.
+"""
+
+from graphviz import Digraph
+
+from docgen import phases
+from docgen.embed import embed_format
+from docgen.render import render_diagram, submit as submit_render
+
+VARIANTS = ('compact', 'presentation')
+
+# (diagram, variant) -> function returning the Digraph
+_registry = {}
+
+# (diagram, variant) -> DOT source already built in this process
+_sources = {}
+
+
+def diagram(name, variant):
+    """Decorator registering a function that builds the Digraph for (name, variant)"""
+    if variant not in VARIANTS:
+        raise ValueError(f"unknown diagram variant '{variant}' (expected one of {', '.join(VARIANTS)})")
+
+    def decorate(fn):
+        _registry[(name, variant)] = fn
+        return fn
+    return decorate
+
+
+def entries():
+    """Every registered (diagram, variant), sorted"""
+    return sorted(_registry)
+
+
+def source(name, variant='compact'):
+    """The Digraph for an entry, built once per process"""
+    key = (name, variant)
+    if key not in _registry:
+        known = ', '.join(f"{n}/{v}" for n, v in entries())
+        raise LookupError(f"no diagram '{name}' with variant '{variant}' (registered: {known})")
+    if key not in _sources:
+        _sources[key] = _registry[key]()
+    return _sources[key]
+
+
+@phases.timed('diagram_source')
+def render(name, variant='compact'):
+    """Render an entry for embedding (see render.render_diagram)
+
+    Identical entries produce identical DOT source, so after the first layout
+    every consumer, in this process or another, is served by the render cache.
+    """
+    return render_diagram(source(name, variant), f"{name}_{variant}")
+
+
+def submit(name, variant='compact'):
+    """Start rendering an entry on a background thread (see render.submit); returns a Future"""
+    return submit_render(render, name, variant)
+
+
+@diagram('architecture', 'compact')
+def _architecture_compact():
+    """Create the layered architecture diagram"""
+    dot = Digraph('Architecture', format=embed_format())
+    dot.attr(rankdir='TB', splines='polyline', nodesep='0.5', ranksep='0.8')
+    dot.attr('node', shape='box', style='filled,rounded', fontname='Arial', fontsize='11')
+    dot.attr('edge', fontname='Arial', fontsize='9')
+    dot.attr(dpi='150')
+
+    # Define subgraphs for each layer
+    with dot.subgraph(name='cluster_presentation') as c:
+        c.attr(label='Shtresa e Prezantimit\n(Presentation Layer)', style='filled', color='#E3F2FD', fontname='Arial Bold')
+        c.node('pages', 'Faqet (Pages)\nDashboard, Projects,\nTasks, Courses', fillcolor='#BBDEFB')
+        c.node('components', 'Komponentet (Components)\nButton, Card, Modal,\nSidebar, Forms', fillcolor='#BBDEFB')
+        c.node('context', 'State Management\nReact Context API', fillcolor='#BBDEFB')
+
+    with dot.subgraph(name='cluster_api') as c:
+        c.attr(label='Shtresa API\n(API Layer)', style='filled', color='#E8F5E9', fontname='Arial Bold')
+        c.node('routes', 'Route Handlers\n/api/auth, /api/projects\n/api/tasks, /api/courses', fillcolor='#C8E6C9')
+        c.node('auth', 'Autentifikimi\nJWT + Cookies', fillcolor='#C8E6C9')
+
+    with dot.subgraph(name='cluster_business') as c:
+        c.attr(label='Shtresa e Logjikes se Biznesit\n(Business Logic Layer)', style='filled', color='#FFF3E0', fontname='Arial Bold')
+        c.node('services', 'Services\nAuthService, ProjectService\nTaskService, CourseService\nNotificationService', fillcolor='#FFE0B2')
+
+    with dot.subgraph(name='cluster_data') as c:
+        c.attr(label='Shtresa e Aksesit te te Dhenave\n(Data Access Layer)', style='filled', color='#FCE4EC', fontname='Arial Bold')
+        c.node('prisma', 'Prisma ORM\nDatabase Client', fillcolor='#F8BBD9')
+        c.node('db', 'PostgreSQL\nDatabase', fillcolor='#F8BBD9', shape='cylinder')
+
+    # Define edges (data flow)
+    dot.edge('pages', 'routes', label='HTTP Requests')
+    dot.edge('components', 'pages', label='', style='dashed')
+    dot.edge('context', 'components', label='', style='dashed')
+    dot.edge('routes', 'auth', label='Verify Token')
+    dot.edge('routes', 'services', label='Call Services')
+    dot.edge('services', 'prisma', label='Database Queries')
+    dot.edge('prisma', 'db', label='SQL')
+
+    return dot
+
+
+@diagram('git_workflow', 'compact')
+def _git_workflow_compact():
+    """Create Git workflow diagram"""
+    dot = Digraph('Git', format=embed_format())
+    dot.attr(rankdir='LR', splines='line', nodesep='0.4')
+    dot.attr('node', shape='box', style='filled,rounded', fontname='Arial', fontsize='10')
+    dot.attr('edge', fontname='Arial', fontsize='8')
+    dot.attr(dpi='150')
+
+    # Git workflow nodes
+    dot.node('working', 'Working Directory\n(Dosja e Punes)', fillcolor='#FFCDD2')
+    dot.node('staging', 'Staging Area\n(Zona e Pergatitjes)', fillcolor='#FFF9C4')
+    dot.node('local', 'Local Repository\n(Repo Lokal)', fillcolor='#C8E6C9')
+    dot.node('remote', 'Remote Repository\n(GitHub)', fillcolor='#BBDEFB')
+
+    # Edges
+    dot.edge('working', 'staging', label='git add')
+    dot.edge('staging', 'local', label='git commit')
+    dot.edge('local', 'remote', label='git push')
+    dot.edge('remote', 'local', label='git pull', style='dashed')
+
+    return dot
+
+
+@diagram('architecture', 'presentation')
+def _architecture_presentation():
+    """Create a clean, presentation-friendly architecture diagram"""
+    dot = Digraph('Architecture', format=embed_format())
+
+    # Clean settings
+    dot.attr(rankdir='TB', splines='ortho', nodesep='0.8', ranksep='1.0',
+             bgcolor='white', pad='0.5', compound='true')
+    dot.attr('node', fontname='Arial', fontsize='12', style='filled,rounded',
+             penwidth='2')
+    dot.attr('edge', fontname='Arial', fontsize='10', penwidth='2')
+    dot.attr(dpi='200')
+
+    # ============================================
+    # LAYER 1: PRESENTATION (Blue)
+    # ============================================
+    with dot.subgraph(name='cluster_presentation') as c:
+        c.attr(label='SHTRESA E PREZANTIMIT\n(Presentation Layer)',
+               style='filled,rounded,bold', color='#1565C0', fillcolor='#E3F2FD',
+               fontname='Arial Bold', fontsize='14', fontcolor='#0D47A1',
+               penwidth='3')
+
+        c.node('pages', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>Faqet (Pages)</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Dashboard</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Projects / Tasks</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Courses / Settings</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#BBDEFB', color='#1976D2')
+
+        c.node('components', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>Komponentet UI</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Button, Card, Modal</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Sidebar, Forms</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#BBDEFB', color='#1976D2')
+
+        c.node('state', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>State Management</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">React Context API</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">NotificationContext</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#BBDEFB', color='#1976D2')
+
+    # ============================================
+    # LAYER 2: API (Green)
+    # ============================================
+    with dot.subgraph(name='cluster_api') as c:
+        c.attr(label='SHTRESA API\n(API Layer)',
+               style='filled,rounded,bold', color='#2E7D32', fillcolor='#E8F5E9',
+               fontname='Arial Bold', fontsize='14', fontcolor='#1B5E20',
+               penwidth='3')
+
+        c.node('routes', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>Route Handlers</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">/api/auth/*</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">/api/projects/*</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">/api/tasks/*</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#C8E6C9', color='#388E3C')
+
+        c.node('auth', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>Autentifikimi</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">JWT Token</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">HttpOnly Cookies</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#C8E6C9', color='#388E3C')
+
+    # ============================================
+    # LAYER 3: BUSINESS LOGIC (Orange)
+    # ============================================
+    with dot.subgraph(name='cluster_business') as c:
+        c.attr(label='SHTRESA E LOGJIKES SE BIZNESIT\n(Business Logic Layer)',
+               style='filled,rounded,bold', color='#E65100', fillcolor='#FFF3E0',
+               fontname='Arial Bold', fontsize='14', fontcolor='#BF360C',
+               penwidth='3')
+
+        c.node('services', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>Services</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">AuthService</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">ProjectService</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">TaskService</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">NotificationService</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#FFE0B2', color='#F57C00')
+
+    # ============================================
+    # LAYER 4: DATA ACCESS (Purple)
+    # ============================================
+    with dot.subgraph(name='cluster_data') as c:
+        c.attr(label='SHTRESA E AKSESIT TE TE DHENAVE\n(Data Access Layer)',
+               style='filled,rounded,bold', color='#6A1B9A', fillcolor='#F3E5F5',
+               fontname='Arial Bold', fontsize='14', fontcolor='#4A148C',
+               penwidth='3')
+
+        c.node('prisma', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>Prisma ORM</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Database Client</FONT></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Query Builder</FONT></TD></TR>
+        </TABLE>>''', shape='box', fillcolor='#E1BEE7', color='#8E24AA')
+
+        c.node('db', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+            <TR><TD><B>PostgreSQL</B></TD></TR>
+            <TR><TD><FONT POINT-SIZE="10">Database</FONT></TD></TR>
+        </TABLE>>''', shape='cylinder', fillcolor='#CE93D8', color='#7B1FA2')
+
+    # ============================================
+    # CONNECTIONS
+    # ============================================
+    dot.edge('pages', 'routes', label='  HTTP Request  ', color='#1976D2',
+             fontcolor='#1976D2', style='bold')
+    dot.edge('components', 'pages', style='dashed', color='#64B5F6', arrowhead='none')
+    dot.edge('state', 'components', style='dashed', color='#64B5F6', arrowhead='none')
+
+    dot.edge('routes', 'auth', label='  Verify  ', color='#388E3C',
+             fontcolor='#388E3C', style='bold')
+    dot.edge('routes', 'services', label='  Call Service  ', color='#388E3C',
+             fontcolor='#388E3C', style='bold')
+
+    dot.edge('services', 'prisma', label='  Query  ', color='#F57C00',
+             fontcolor='#E65100', style='bold')
+
+    dot.edge('prisma', 'db', label='  SQL  ', color='#8E24AA',
+             fontcolor='#6A1B9A', style='bold')
+
+    # Response arrow
+    dot.edge('db', 'pages', label='  Response  ', color='#9E9E9E',
+             fontcolor='#616161', style='dashed', constraint='false')
+
+    return dot
+
+
+@diagram('git_workflow', 'presentation')
+def _git_workflow_presentation():
+    """Create a clean Git workflow diagram"""
+    dot = Digraph('Git', format=embed_format())
+
+    # Settings for horizontal flow
+    dot.attr(rankdir='LR', splines='spline', nodesep='1.2', ranksep='1.5',
+             bgcolor='white', pad='0.5')
+    dot.attr('node', fontname='Arial', fontsize='13', style='filled,rounded',
+             penwidth='3', height='1.2', width='2')
+    dot.attr('edge', fontname='Arial Bold', fontsize='12', penwidth='3')
+    dot.attr(dpi='200')
+
+    # Git workflow nodes with icons/symbols
+    dot.node('working', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+        <TR><TD><FONT POINT-SIZE="24">📁</FONT></TD></TR>
+        <TR><TD><B>Working Directory</B></TD></TR>
+        <TR><TD><FONT POINT-SIZE="10" COLOR="#666666">Dosja e Punes</FONT></TD></TR>
+        <TR><TD><FONT POINT-SIZE="9" COLOR="#888888">Skedaret lokale</FONT></TD></TR>
+    </TABLE>>''', shape='box', fillcolor='#FFCDD2', color='#C62828')
+
+    dot.node('staging', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+        <TR><TD><FONT POINT-SIZE="24">📋</FONT></TD></TR>
+        <TR><TD><B>Staging Area</B></TD></TR>
+        <TR><TD><FONT POINT-SIZE="10" COLOR="#666666">Zona e Pergatitjes</FONT></TD></TR>
+        <TR><TD><FONT POINT-SIZE="9" COLOR="#888888">Gati per commit</FONT></TD></TR>
+    </TABLE>>''', shape='box', fillcolor='#FFF9C4', color='#F9A825')
+
+    dot.node('local', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+        <TR><TD><FONT POINT-SIZE="24">💾</FONT></TD></TR>
+        <TR><TD><B>Local Repository</B></TD></TR>
+        <TR><TD><FONT POINT-SIZE="10" COLOR="#666666">Repo Lokal</FONT></TD></TR>
+        <TR><TD><FONT POINT-SIZE="9" COLOR="#888888">Historia e commits</FONT></TD></TR>
+    </TABLE>>''', shape='box', fillcolor='#C8E6C9', color='#2E7D32')
+
+    dot.node('remote', '''<<TABLE BORDER="0" CELLBORDER="0" CELLSPACING="4">
+        <TR><TD><FONT POINT-SIZE="24">☁️</FONT></TD></TR>
+        <TR><TD><B>Remote Repository</B></TD></TR>
+        <TR><TD><FONT POINT-SIZE="10" COLOR="#666666">GitHub / GitLab</FONT></TD></TR>
+        <TR><TD><FONT POINT-SIZE="9" COLOR="#888888">Cloud storage</FONT></TD></TR>
+    </TABLE>>''', shape='box', fillcolor='#BBDEFB', color='#1565C0')
+
+    # Forward arrows (main flow)
+    dot.edge('working', 'staging', label='  git add  ', color='#E65100',
+             fontcolor='#E65100', style='bold')
+    dot.edge('staging', 'local', label='  git commit  ', color='#2E7D32',
+             fontcolor='#2E7D32', style='bold')
+    dot.edge('local', 'remote', label='  git push  ', color='#1565C0',
+             fontcolor='#1565C0', style='bold')
+
+    # Backward arrows
+    dot.edge('remote', 'local', label='  git fetch  ', color='#7B1FA2',
+             fontcolor='#7B1FA2', style='dashed')
+    dot.edge('remote', 'working', label='  git pull  ', color='#C62828',
+             fontcolor='#C62828', style='dashed', constraint='false')
+
+    return dot
@@ -0,0 +1,260 @@
+"""
+Declarative Documents
+Documents described as lists of blocks (headings, paragraphs, tables, code, diagrams) and
+turned into flowables by one renderer whose styles are compiled once per process
+
+    DOCUMENT = [
+        ('title', "9. Arkitektura e Sistemit"),
+        ('heading', "9.1 Arkitektura e Zgjedhur"),
+        ('body', "Projekti yne perdor <b>Arkitekturen e Shtresuar</b> ..."),
+        ('table', 'list', [["1.", "Ndarje e qarte e pergjegjsive"]], [0.5*inch, 5.5*inch]),
+        ('table', 'grid', [["Komanda", "Pershkrimi"], ...], widths, {'palette': 'grey', 'mono': [0]}),
+        ('diagram', 'arch_diagram', 15*cm, 12*cm),
+        ('code', 'src/services/AuthService.ts', 'AuthService', {'outline': True}),
+        ('pagebreak',),
+    ]
+    content = document.render(DOCUMENT, 'report', diagrams={'arch_diagram': arch_diagram})
+
+A block is (kind, *arguments), optionally ending in a dict of options. Text
+blocks take their style from the theme: title, subtitle, heading, subheading
+and body. 'spacer' takes a height and 'flowables' a list of ready-made
+flowables (e.g. the Jest result tables).
+"""
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import PageBreak, Paragraph, Spacer, Table, TableStyle
+
+from docgen import fonts, phases
+from docgen.embed import diagram_flowable
+from docgen.highlight import code_block
+from docgen.snippets import snippet
+
+# Paragraph styles per theme, as (sample stylesheet parent, overrides) for each role
+THEMES = {
+    'report': {
+        'title': ('Heading1', dict(fontSize=24, spaceAfter=30, alignment=TA_CENTER, textColor='#1565C0')),
+        'subtitle': ('Italic', {}),
+        'heading': ('Heading2', dict(fontSize=16, spaceBefore=20, spaceAfter=12, textColor='#1976D2')),
+        'subheading': ('Heading3', dict(fontSize=13, spaceBefore=15, spaceAfter=8, textColor='#424242')),
+        'body': ('Normal', dict(fontSize=11, spaceAfter=10, alignment=TA_JUSTIFY, leading=16)),
+        'code': ('Code', dict(fontSize=9, leading=12, spaceAfter=10, backColor='#F5F5F5',
+                              borderColor='#E0E0E0', borderWidth=1, borderPadding=8)),
+    },
+    'compact': {
+        'title': ('Heading1', dict(fontSize=22, spaceAfter=20, alignment=TA_CENTER, textColor='#1565C0')),
+        'subtitle': ('Italic', {}),
+        'heading': ('Heading2', dict(fontSize=14, spaceBefore=15, spaceAfter=8, textColor='#1976D2')),
+        'subheading': ('Heading3', dict(fontSize=11, spaceBefore=10, spaceAfter=5, textColor='#424242')),
+        'body': ('Normal', dict(fontSize=10, spaceAfter=8, alignment=TA_JUSTIFY, leading=14)),
+        'code': ('Normal', dict(fontSize=7, leading=9, spaceAfter=6, backColor='#F5F5F5',
+                                borderColor='#E0E0E0', borderWidth=1, borderPadding=8)),
+    },
+    'presentation': {
+        'title': ('Heading1', dict(fontSize=28, spaceAfter=5, alignment=TA_CENTER, textColor='#1565C0')),
+        'subtitle': ('Normal', dict(fontSize=12, spaceAfter=15, alignment=TA_CENTER, textColor='#666666')),
+        'heading': ('Heading2', dict(fontSize=14, spaceBefore=15, spaceAfter=8, textColor='#1976D2')),
+        'subheading': ('Heading3', dict(fontSize=12, spaceBefore=10, spaceAfter=6, textColor='#424242')),
+        'body': ('Normal', dict(fontSize=10, spaceAfter=8, alignment=TA_JUSTIFY, leading=14)),
+        'code': ('Normal', dict(fontSize=8, leading=10, spaceAfter=6, backColor='#F5F5F5',
+                                borderColor='#E0E0E0', borderWidth=1, borderPadding=8)),
+    },
+}
+
+# Text roles rendered as a Paragraph; 'heading' paragraphs become handbook bookmarks
+TEXT_ROLES = ('title', 'subtitle', 'heading', 'subheading', 'body')
+
+# Table colours as (header, body fill, grid)
+PALETTES = {
+    'blue': ('#1976D2', '#E3F2FD', '#90CAF9'),
+    'navy': ('#1565C0', '#E3F2FD', '#90CAF9'),
+    'grey': ('#424242', '#FAFAFA', '#BDBDBD'),
+    'green': ('#4CAF50', '#E8F5E9', '#A5D6A7'),
+    'dark_green': ('#2E7D32', '#E8F5E9', '#A5D6A7'),
+    'orange': ('#EF6C00', '#FFF3E0', '#FFCC80'),
+    'pink': ('#C2185B', '#FCE4EC', '#F48FB1'),
+    'purple': ('#673AB7', '#EDE7F6', '#B39DDB'),
+    'lavender': ('#8E24AA', '#F3E5F5', '#CE93D8'),
+}
+
+# Alternating body rows of striped tables, and their lighter grid
+STRIPES = ('#FFFFFF', '#F5F5F5')
+STRIPE_GRID = '#E0E0E0'
+
+# (theme, role) -> ParagraphStyle and (kind, options) -> TableStyle, compiled once per process
+_paragraph_styles = {}
+_table_styles = {}
+
+
+def styles(theme):
+    """The compiled ParagraphStyles of a theme, by role"""
+    compiled = _paragraph_styles.get(theme)
+    if compiled is None:
+        sheet = fonts.sample_styles()
+        compiled = {}
+        for role, (parent, overrides) in THEMES[theme].items():
+            values = {key: colors.HexColor(value) if isinstance(value, str) and value.startswith('#') else value
+                      for key, value in overrides.items()}
+            if role == 'code':
+                values.setdefault('fontName', fonts.MONO)
+            compiled[role] = ParagraphStyle(f"{theme}-{role}", parent=sheet[parent], **values)
+        _paragraph_styles[theme] = compiled
+    return compiled
+
+
+def _list_commands(size=10, padding=6, bold=()):
+    """Borderless rows, e.g. numbered reasons: ["1.", "..."]"""
+    commands = [
+        ('FONTNAME', (0, 0), (-1, -1), fonts.SANS),
+        ('FONTSIZE', (0, 0), (-1, -1), size),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+    ]
+    commands += [('FONTNAME', (col, 0), (col, -1), fonts.SANS_BOLD) for col in bold]
+    return commands
+
+
+def _info_commands(palette='blue', size=9, padding=6):
+    """Label/value rows on a tinted background, labels in bold"""
+    _, fill, grid = PALETTES[palette]
+    return [
+        ('FONTNAME', (0, 0), (-1, -1), fonts.SANS),
+        ('FONTSIZE', (0, 0), (-1, -1), size),
+        ('FONTNAME', (0, 0), (0, -1), fonts.SANS_BOLD),
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(fill)),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor(grid)),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('PADDING', (0, 0), (-1, -1), padding),
+    ]
+
+
+def _grid_commands(palette='blue', size=10, padding=8, header_size=None, valign='MIDDLE', mono=(),
+                   center=(), text_colors=(), stripes=False, fills=(), grid=0.5, border=None):
+    """A header row in the palette's colour over a gridded body
+
+    `mono` and `center` list body columns set in the monospaced face or
+    centred, `text_colors` pairs a column with a text colour, `stripes`
+    alternates the body rows and `fills` gives each body row its own palette;
+    `border` names the palette of the grid lines when it is not the header's.
+    """
+    header, fill, lines = PALETTES[palette]
+    if border:
+        lines = PALETTES[border][2]
+    commands = [
+        ('FONTNAME', (0, 0), (-1, 0), fonts.SANS_BOLD),
+        ('FONTNAME', (0, 1), (-1, -1), fonts.SANS),
+        ('FONTSIZE', (0, 0), (-1, -1), size),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(fill)),
+        ('GRID', (0, 0), (-1, -1), grid, colors.HexColor(STRIPE_GRID if stripes else lines)),
+        ('VALIGN', (0, 0), (-1, -1), valign),
+        ('PADDING', (0, 0), (-1, -1), padding),
+    ]
+    if header_size:
+        commands.append(('FONTSIZE', (0, 0), (-1, 0), header_size))
+    commands += [('FONTNAME', (col, 1), (col, -1), fonts.MONO) for col in mono]
+    commands += [('ALIGN', (col, 0), (col, -1), 'CENTER') for col in center]
+    commands += [('TEXTCOLOR', (col, 1), (col, -1), colors.HexColor(color)) for col, color in text_colors]
+    commands += [('BACKGROUND', (0, row), (-1, row), colors.HexColor(PALETTES[name][1]))
+                 for row, name in enumerate(fills, start=1)]
+    if stripes:
+        commands.append(('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor(c) for c in STRIPES]))
+    return commands
+
+
+def _legend_commands(size=10, padding=8):
+    """A grey caption spanning the first row over borderless key/meaning pairs"""
+    return [
+        ('FONTNAME', (0, 0), (-1, -1), fonts.SANS),
+        ('FONTNAME', (0, 0), (-1, 0), fonts.SANS_BOLD),
+        ('FONTSIZE', (0, 0), (-1, -1), size),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('SPAN', (0, 0), (-1, 0)),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E0E0E0')),
+        ('PADDING', (0, 0), (-1, -1), padding),
+    ]
+
+
+TABLE_KINDS = {
+    'list': _list_commands,
+    'info': _info_commands,
+    'grid': _grid_commands,
+    'legend': _legend_commands,
+}
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def table_style(kind, options=None):
+    """The TableStyle for a table kind and its options, compiled once per process"""
+    options = options or {}
+    key = (kind, _freeze(options))
+    compiled = _table_styles.get(key)
+    if compiled is None:
+        fonts.register()
+        compiled = _table_styles[key] = TableStyle(TABLE_KINDS[kind](**options))
+    return compiled
+
+
+def _split_options(block):
+    if len(block) > 1 and isinstance(block[-1], dict):
+        return block[1:-1], block[-1]
+    return block[1:], {}
+
+
+def code_paths(blocks):
+    """Source files shown by the 'code' blocks; docgen/build.py finds the same ones statically"""
+    paths = []
+    for block in blocks:
+        if block[0] == 'code' and block[1] not in paths:
+            paths.append(block[1])
+    return paths
+
+
+def render(blocks, theme, diagrams=None):
+    """Turn a list of blocks into flowables using a theme's styles
+
+    `diagrams` maps the names used by 'diagram' blocks to rendered diagrams
+    (a path, a BytesIO or a Future of either, see embed.diagram_flowable).
+    """
+    phases.switch('styles')
+    style = styles(theme)
+    phases.switch('flowables')
+
+    content = []
+    for block in blocks:
+        kind = block[0]
+        args, options = _split_options(block)
+        if kind in TEXT_ROLES:
+            paragraph = Paragraph(args[0], style[kind])
+            if kind == 'heading':
+                paragraph.outline_level = 1
+            content.append(paragraph)
+        elif kind == 'spacer':
+            content.append(Spacer(1, args[0]))
+        elif kind == 'pagebreak':
+            content.append(PageBreak())
+        elif kind == 'table':
+            table_kind, rows, widths = args
+            table = Table(rows, colWidths=widths)
+            table.setStyle(table_style(table_kind, options))
+            content.append(table)
+        elif kind == 'diagram':
+            name, width, height = args
+            content.append(diagram_flowable(diagrams[name], width, height))
+        elif kind == 'code':
+            path, *names = args
+            content.append(code_block(snippet(path, *names, **options), style['code']))
+        elif kind == 'flowables':
+            content.extend(args[0])
+        else:
+            raise ValueError(f"unknown block kind '{kind}'")
+    return content
@@ -0,0 +1,79 @@
+"""
+Draft Previews
+DOCS_DRAFT=1 (build_docs.py --draft) lays out every document's text and tables as usual
+but skips Graphviz layouts, image decoding and page compression, for checking pagination
+
+Diagrams become labelled boxes the size of their last known render (from the
+render cache), or of their whole placement when they were never rendered.
+"""
+
+import os
+import re
+
+from reportlab.lib import colors
+from reportlab.platypus import Flowable
+
+from docgen import fonts
+from docgen.raster import fit, png_size
+
+_SVG_SIZE_RE = re.compile(rb'<svg\b[^>]*?\bwidth="([\d.]+)[a-z]*"[^>]*?\bheight="([\d.]+)[a-z]*"')
+
+
+def enabled():
+    return os.environ.get('DOCS_DRAFT', '') not in ('', '0')
+
+
+def page_compression():
+    """pageCompression for a DocTemplate: off in drafts, ReportLab's default otherwise"""
+    return 0 if enabled() else None
+
+
+def render_size(data):
+    """(width, height) of a rendered diagram from its PNG or SVG header, or None"""
+    if data.startswith(b'\x89PNG'):
+        return png_size(data)
+    match = _SVG_SIZE_RE.search(data[:2048])
+    if match:
+        return float(match.group(1)), float(match.group(2))
+    return None
+
+
+class Placeholder(Flowable):
+    """A labelled box standing in for a diagram"""
+
+    def __init__(self, label, width, height):
+        Flowable.__init__(self)
+        self.label = label
+        self.width = width
+        self.height = height
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        canvas.saveState()
+        canvas.setFillColor(colors.HexColor('#F5F5F5'))
+        canvas.setStrokeColor(colors.HexColor('#9E9E9E'))
+        canvas.setDash(4, 3)
+        canvas.rect(0, 0, self.width, self.height, stroke=1, fill=1)
+        canvas.setFillColor(colors.HexColor('#616161'))
+        canvas.setFont(fonts.SANS, 10)
+        canvas.drawCentredString(self.width / 2, self.height / 2 - 4, f"[draft] {self.label}")
+        canvas.restoreState()
+
+
+def placeholder(diagram, width, height):
+    """A Placeholder for a rendered diagram (a path or a BytesIO) in a width x height box"""
+    if isinstance(diagram, str):
+        label = os.path.splitext(os.path.basename(diagram))[0]
+        with open(diagram, 'rb') as f:
+            data = f.read(2048)
+    else:
+        label = getattr(diagram, 'name', 'diagram')
+        data = diagram.getvalue()
+    size = render_size(data)
+    if size:
+        width, height = fit(size, width, height)
+    return Placeholder(label, width, height)
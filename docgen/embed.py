@@ -0,0 +1,96 @@
+"""
+Diagram Embedding
+Places rendered Graphviz diagrams in a document as vector drawings or raster images
+"""
+
+import io
+import os
+from concurrent.futures import Future
+
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:  # svglib is optional; without it diagrams stay PNG rasters
+    svg2rlg = None
+
+from reportlab.platypus import Flowable
+
+from docgen import draft, phases
+from docgen.raster import raster_flowable
+
+
+def diagram_mode():
+    """'vector' (default) embeds Graphviz SVG as a ReportLab drawing, 'raster' embeds PNG"""
+    mode = os.environ.get('DOCS_DIAGRAM_MODE', 'vector')
+    if mode == 'vector' and svg2rlg is None:
+        return 'raster'
+    return mode
+
+
+def embed_format():
+    """Graphviz output format for diagrams that end up inside a PDF"""
+    return 'svg' if diagram_mode() == 'vector' else 'png'
+
+
+def _is_svg(diagram):
+    if isinstance(diagram, str):
+        return diagram.endswith('.svg')
+    return diagram.getvalue().lstrip()[:1] == b'<'
+
+
+class DeferredDiagram(Flowable):
+    """A diagram still rendering (see render.submit), waited for when its page is laid out"""
+
+    def __init__(self, future, width, height):
+        Flowable.__init__(self)
+        self.future = future
+        self.box = (width, height)
+        self.flowable = None
+
+    def _resolve(self):
+        if self.flowable is None:
+            self.flowable = diagram_flowable(self.future.result(), *self.box)
+            self.hAlign = self.flowable.hAlign
+        return self.flowable
+
+    def wrap(self, availWidth, availHeight):
+        self.width, self.height = self._resolve().wrap(availWidth, availHeight)
+        return self.width, self.height
+
+    def draw(self):
+        self.flowable.drawOn(self.canv, 0, 0)
+
+
+def diagram_flowable(diagram, width, height):
+    """Fit a rendered diagram into a width x height box
+
+    `diagram` is a file path, an in-memory BytesIO, or a Future of either
+    (render.submit), which becomes a DeferredDiagram.
+    """
+    if isinstance(diagram, Future):
+        return DeferredDiagram(diagram, width, height)
+    return _diagram_flowable(diagram, width, height)
+
+
+@phases.timed('image_decode')
+def _diagram_flowable(diagram, width, height):
+    if draft.enabled():
+        return draft.placeholder(diagram, width, height)
+    if not isinstance(diagram, str):
+        # Hand each consumer its own buffer so read positions never interfere
+        diagram = io.BytesIO(diagram.getvalue())
+
+    if not _is_svg(diagram):
+        # Sized for the box and the print target rather than stretched to it
+        if isinstance(diagram, str):
+            with open(diagram, 'rb') as f:
+                return raster_flowable(f.read(), width, height)
+        return raster_flowable(diagram.getvalue(), width, height)
+
+    drawing = svg2rlg(diagram)
+    # Vector output keeps its aspect ratio instead of being stretched to the box
+    scale = min(width / drawing.width, height / drawing.height)
+    drawing.scale(scale, scale)
+    drawing.width *= scale
+    drawing.height *= scale
+    drawing.hAlign = 'CENTER'
+    return drawing
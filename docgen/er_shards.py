@@ -0,0 +1,173 @@
+"""
+ER Schema Sharding
+Splits a schema into domain clusters by relation density so each can be laid out on its own page
+"""
+
+from collections import Counter, defaultdict, deque
+
+# Largest number of models laid out together on one page
+MAX_SHARD_SIZE = 20
+
+# A model is a hub (like User) when it links to this many times the average
+# number of neighbours; hubs do not pull other models into their cluster
+HUB_FACTOR = 3
+HUB_MIN_DEGREE = 8
+
+MAX_ITERATIONS = 20
+
+
+def _adjacency(model_names, edges):
+    adj = {name: Counter() for name in model_names}
+    for edge in edges:
+        if edge.parent != edge.child:
+            adj[edge.parent][edge.child] += 1
+            adj[edge.child][edge.parent] += 1
+    return adj
+
+
+def find_hubs(adj):
+    """Models with far more neighbours than average"""
+    if not adj:
+        return set()
+    mean = sum(len(n) for n in adj.values()) / len(adj)
+    threshold = max(HUB_MIN_DEGREE, HUB_FACTOR * mean)
+    return {name for name, neighbours in adj.items() if len(neighbours) >= threshold}
+
+
+def _propagate_labels(adj, hubs):
+    """Weighted label propagation; each pass is linear in the number of edges"""
+    labels = {name: name for name in adj}
+    order = sorted(adj)
+    for _ in range(MAX_ITERATIONS):
+        changed = False
+        for name in order:
+            if name in hubs:
+                continue
+            weights = Counter()
+            for other, count in adj[name].items():
+                if other not in hubs:
+                    weights[labels[other]] += count
+            if not weights:
+                continue
+            top = max(weights.values())
+            candidates = sorted(label for label, w in weights.items() if w == top)
+            best = labels[name] if labels[name] in candidates else candidates[0]
+            if best != labels[name]:
+                labels[name] = best
+                changed = True
+        if not changed:
+            break
+    return labels
+
+
+def _split(members, adj, size):
+    """Cut an oversized cluster into chunks of at most `size` models, keeping neighbours together"""
+    # Best connected models first, so each chunk grows from a local centre
+    remaining = sorted(members, key=lambda n: (-len(adj[n]), n))
+    unplaced = set(members)
+    chunks = []
+    while unplaced:
+        chunk, queue = [], deque()
+        while (queue or unplaced) and len(chunk) < size:
+            if not queue:
+                while remaining[0] not in unplaced:
+                    remaining.pop(0)
+                unplaced.discard(remaining[0])
+                queue.append(remaining[0])
+            name = queue.popleft()
+            chunk.append(name)
+            for other in sorted(adj[name], key=lambda n: -adj[name][n]):
+                if other in unplaced:
+                    unplaced.discard(other)
+                    queue.append(other)
+        # Anything queued but not placed goes back for the next chunk
+        unplaced.update(queue)
+        chunks.append(chunk)
+    return chunks
+
+
+def _pack(shards, adj, hubs, size):
+    """Merge small shards into the neighbour they share most links with, then bin the rest"""
+    shard_of = {name: i for i, shard in enumerate(shards) for name in shard}
+    merged = set()
+    small = []
+    for i in sorted(range(len(shards)), key=lambda i: (len(shards[i]), i)):
+        if len(shards[i]) >= size // 2:
+            continue
+        weights = Counter()
+        for name in shards[i]:
+            for other, count in adj[name].items():
+                if other in hubs:
+                    continue
+                j = shard_of[other]
+                if j != i and len(shards[j]) + len(shards[i]) <= size:
+                    weights[j] += count
+        if weights:
+            j = max(sorted(weights), key=weights.get)
+            shards[j].extend(shards[i])
+            for name in shards[i]:
+                shard_of[name] = j
+            merged.add(i)
+        else:
+            small.append(i)
+
+    # Small shards with nowhere to go (e.g. models that only link to hubs)
+    # share pages instead of getting one each
+    result = [shard for i, shard in enumerate(shards) if i not in merged and i not in small]
+    bin_ = []
+    for i in small:
+        if i in merged:
+            continue
+        if len(bin_) + len(shards[i]) > size:
+            result.append(bin_)
+            bin_ = []
+        bin_ = bin_ + shards[i]
+    if bin_:
+        result.append(bin_)
+    return result
+
+
+def shard_models(model_names, edges, max_size=MAX_SHARD_SIZE):
+    """Group models into shards of related models
+
+    Returns a list of model-name lists, largest first. Hubs join the shard
+    holding most of their neighbours; links to them from other shards become
+    cross-shard links.
+    """
+    adj = _adjacency(model_names, edges)
+    hubs = find_hubs(adj)
+    labels = _propagate_labels(adj, hubs)
+
+    clusters = defaultdict(list)
+    for name in model_names:
+        if name not in hubs:
+            clusters[labels[name]].append(name)
+
+    shards = []
+    for members in clusters.values():
+        if len(members) > max_size:
+            shards.extend(_split(members, adj, max_size))
+        else:
+            shards.append(members)
+    shards = _pack(shards, adj, hubs, max_size)
+
+    # Hubs go where most of their neighbours are
+    for hub in sorted(hubs):
+        if not shards:
+            shards.append([hub])
+            continue
+        scores = [sum(adj[hub][m] for m in shard) for shard in shards]
+        shards[max(range(len(shards)), key=lambda i: (scores[i], -i))].append(hub)
+
+    return sorted(shards, key=lambda shard: (-len(shard), shard[0]))
+
+
+def cross_links(shards, edges):
+    """Count links between shards: {(shard_a, shard_b): count} with shard_a < shard_b"""
+    shard_of = {name: i for i, shard in enumerate(shards) for name in shard}
+    counts = Counter()
+    for edge in edges:
+        a, b = shard_of.get(edge.parent), shard_of.get(edge.child)
+        if a is not None and b is not None and a != b:
+            counts[(min(a, b), max(a, b))] += 1
+    return counts
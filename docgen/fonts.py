@@ -0,0 +1,147 @@
+"""
+Document Fonts
+Registers a Unicode TrueType family once per process so every generator can print
+Albanian (ë, ç) and English text, with only the glyphs a document uses embedded
+
+    from docgen import fonts
+    styles = fonts.sample_styles()
+    ('FONTNAME', (0, 0), (-1, 0), fonts.SANS_BOLD)
+
+Set DOCS_FONT_DIR to a directory with the TTF files, or DOCS_FONTS=builtin to
+keep the PDF base fonts (Helvetica/Courier), which are never embedded.
+"""
+
+import os
+from collections import OrderedDict
+
+import reportlab
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+# Face names; register() switches them from the base fonts to the TTF family it finds
+SANS = 'Helvetica'
+SANS_BOLD = 'Helvetica-Bold'
+SANS_ITALIC = 'Helvetica-Oblique'
+SANS_BOLD_ITALIC = 'Helvetica-BoldOblique'
+MONO = 'Courier'
+MONO_BOLD = 'Courier-Bold'
+MONO_ITALIC = 'Courier-Oblique'
+MONO_BOLD_ITALIC = 'Courier-BoldOblique'
+
+# Candidate files as (regular, bold, italic, bold italic), most complete coverage first
+SANS_FAMILIES = [
+    ('DejaVuSans.ttf', 'DejaVuSans-Bold.ttf', 'DejaVuSans-Oblique.ttf', 'DejaVuSans-BoldOblique.ttf'),
+    ('arial.ttf', 'arialbd.ttf', 'ariali.ttf', 'arialbi.ttf'),
+    ('Vera.ttf', 'VeraBd.ttf', 'VeraIt.ttf', 'VeraBI.ttf'),  # shipped with ReportLab
+]
+MONO_FAMILIES = [
+    ('DejaVuSansMono.ttf', 'DejaVuSansMono-Bold.ttf', 'DejaVuSansMono-Oblique.ttf',
+     'DejaVuSansMono-BoldOblique.ttf'),
+    ('consola.ttf', 'consolab.ttf', 'consolai.ttf', 'consolaz.ttf'),
+]
+
+FONT_DIRS = [
+    os.environ.get('DOCS_FONT_DIR', ''),
+    'fonts',
+    '/usr/share/fonts/truetype/dejavu',
+    '/usr/share/fonts/dejavu',
+    '/usr/share/fonts/TTF',
+    '/Library/Fonts',
+    os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+    os.path.join(os.path.dirname(reportlab.__file__), 'fonts'),
+]
+
+# Subsets kept per face; a subset is at most 256 glyphs, so this stays a few MB
+SUBSET_CACHE_SIZE = 64
+
+_registered = False
+
+
+def _find(filename):
+    for directory in FONT_DIRS:
+        if directory:
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def _cache_subsets(font):
+    """Reuse subset data for glyph sets already embedded by another document in this process"""
+    face = font.face
+    make = face.makeSubset
+    cache = OrderedDict()
+
+    def makeSubset(subset):
+        key = tuple(subset)
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        data = cache[key] = make(subset)
+        if len(cache) > SUBSET_CACHE_SIZE:
+            cache.popitem(last=False)
+        return data
+
+    face.makeSubset = makeSubset
+
+
+def _register_family(family, candidates):
+    """Register the first candidate with a regular and bold face; returns its 4 face names or None"""
+    for files in candidates:
+        paths = [_find(f) for f in files]
+        if not (paths[0] and paths[1]):
+            continue
+        names = [family, f'{family}-Bold', f'{family}-Italic', f'{family}-BoldItalic']
+        # A missing italic uses the upright face of the same weight
+        for italic, upright in ((2, 0), (3, 1)):
+            if not paths[italic]:
+                names[italic] = names[upright]
+        for name, path in zip(names, paths):
+            if path and name not in pdfmetrics.getRegisteredFontNames():
+                font = TTFont(name, path)
+                _cache_subsets(font)
+                pdfmetrics.registerFont(font)
+        pdfmetrics.registerFontFamily(family, normal=names[0], bold=names[1],
+                                      italic=names[2], boldItalic=names[3])
+        return names
+    return None
+
+
+def register():
+    """Register the document fonts once per process; later calls are free"""
+    global _registered, SANS, SANS_BOLD, SANS_ITALIC, SANS_BOLD_ITALIC
+    global MONO, MONO_BOLD, MONO_ITALIC, MONO_BOLD_ITALIC
+    if _registered:
+        return
+    _registered = True
+    if os.environ.get('DOCS_FONTS') == 'builtin':
+        return
+
+    sans = _register_family('DocSans', SANS_FAMILIES)
+    if sans:
+        SANS, SANS_BOLD, SANS_ITALIC, SANS_BOLD_ITALIC = sans
+    mono = _register_family('DocMono', MONO_FAMILIES)
+    if mono:
+        MONO, MONO_BOLD, MONO_ITALIC, MONO_BOLD_ITALIC = mono
+
+
+def face(name):
+    """The registered face standing in for a base font name such as 'Helvetica-Bold'"""
+    register()
+    return {
+        'Helvetica': SANS, 'Helvetica-Bold': SANS_BOLD,
+        'Helvetica-Oblique': SANS_ITALIC, 'Helvetica-BoldOblique': SANS_BOLD_ITALIC,
+        'Courier': MONO, 'Courier-Bold': MONO_BOLD,
+        'Courier-Oblique': MONO_ITALIC, 'Courier-BoldOblique': MONO_BOLD_ITALIC,
+    }.get(name, name)
+
+
+def sample_styles():
+    """getSampleStyleSheet() with its fonts switched to the registered family"""
+    register()
+    styles = getSampleStyleSheet()
+    for style in styles.byName.values():
+        if hasattr(style, 'fontName'):
+            style.fontName = face(style.fontName)
+    return styles
@@ -0,0 +1,119 @@
+"""
+Combined Handbook
+One bookmarked PDF holding every generator's document, assembled from the generators'
+own flowables so fonts and repeated images are embedded once
+
+    python build_docs.py --handbook
+
+Each section keeps its generator's page size and margins (PAGE) and gets a
+top-level bookmark; its headings become bookmarks below it.
+"""
+
+import importlib
+import io
+
+from reportlab.platypus import BaseDocTemplate, Flowable, Frame, NextPageTemplate, PageBreak, PageTemplate
+
+from docgen import build, draft, output, phases, render
+
+OUTPUT = 'handbook.pdf'
+
+TITLE = 'Project Management System - Documentation Handbook'
+
+# Generators in handbook order, with the title of their top-level bookmark
+SECTIONS = [
+    ('generate_architecture_pdf', 'System Architecture'),
+    ('generate_diagrams_presentation', 'Architecture & Git Workflow Diagrams'),
+    ('generate_er_diagram_presentation', 'Entity-Relationship Diagram'),
+    ('generate_design_patterns_pdf', 'Design Patterns'),
+    ('generate_testing_pdf', 'Unit Testing & Coverage'),
+    ('generate_tests_documentation', 'Tests Documentation'),
+]
+
+
+def target(targets):
+    """The handbook as a build target over the section targets among `targets`
+
+    Its diagram parameters are the sections' own, prefixed with the section
+    module ('generate_architecture_pdf.arch_diagram'), so the driver hands it
+    the same shared renders as the separate documents.
+    """
+    modules = {module for module, _ in SECTIONS}
+    sections = [t for t in targets if t.module in modules]
+    diagrams = [(f"{t.module}.{param}", node) for t in sections for param, node in t.diagrams]
+    inputs = ['docgen/handbook.py']
+    for section in sections:
+        inputs.extend(p for p in section.inputs if p not in inputs)
+    return build.Target(__name__, 'create_pdf', diagrams, OUTPUT, inputs)
+
+
+class Bookmark(Flowable):
+    """Zero-size flowable adding an outline entry for the page it lands on"""
+
+    def __init__(self, title, key, level=0):
+        Flowable.__init__(self)
+        self.title = title
+        self.key = key
+        self.level = level
+
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, self.level)
+
+
+class HandbookTemplate(BaseDocTemplate):
+    """Adds a second-level bookmark for every section heading (docgen/document.py marks them)"""
+
+    def __init__(self, *args, **kwargs):
+        BaseDocTemplate.__init__(self, *args, **kwargs)
+        self._headings = 0
+
+    def afterFlowable(self, flowable):
+        if getattr(flowable, 'outline_level', None) == 1:
+            self._headings += 1
+            key = f"heading{self._headings}"
+            self.canv.bookmarkPage(key)
+            self.canv.addOutlineEntry(flowable.getPlainText(), key, level=1)
+
+
+def _page_template(module, page):
+    width, height = page['pagesize']
+    # The frame SimpleDocTemplate would give the generator's own document
+    frame = Frame(page['leftMargin'], page['bottomMargin'],
+                  width - page['leftMargin'] - page['rightMargin'],
+                  height - page['topMargin'] - page['bottomMargin'], id=module)
+    return PageTemplate(id=module, frames=[frame], pagesize=page['pagesize'])
+
+
+@phases.timed('flowables')
+def create_pdf(**diagrams):
+    """Build the handbook; `diagrams` are renders keyed '<section module>.<parameter>'
+
+    Renders the build driver did not pass in are started here on render
+    threads, as the separate documents would start them.
+    """
+    for param, (module, function, kwargs) in target(build.discover()).diagrams:
+        if param not in diagrams:
+            diagrams[param] = render.submit(getattr(importlib.import_module(module), function), **dict(kwargs))
+
+    generators = [(importlib.import_module(module), title) for module, title in SECTIONS]
+    buffer = io.BytesIO()
+    doc = HandbookTemplate(buffer, title=TITLE, pageCompression=draft.page_compression(),
+                           pageTemplates=[_page_template(g.__name__, g.PAGE) for g, _ in generators])
+
+    content = []
+    for i, (generator, title) in enumerate(generators):
+        if i:
+            content.extend([NextPageTemplate(generator.__name__), PageBreak()])
+        content.append(Bookmark(title, generator.__name__))
+        prefix = generator.__name__ + '.'
+        kwargs = {key[len(prefix):]: value for key, value in diagrams.items() if key.startswith(prefix)}
+        content.extend(generator.create_content(**kwargs))
+
+    phases.switch('build')
+    doc.build(content)
+    path = output.publish(OUTPUT, buffer.getvalue())
+    print(f"Handbook generated successfully: {path}")
@@ -0,0 +1,199 @@
+"""
+Syntax-Highlighted Code Blocks
+Tokenizes TypeScript/TSX snippets (cached by snippet hash) and draws them as a
+flowable that splits across pages line by line
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from reportlab.lib import colors
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.platypus import Flowable
+
+CACHE_DIR = os.path.join(os.environ.get('DOCS_CACHE_DIR', '.docs_cache'), 'highlight')
+
+# Bump when the tokenizer changes so cached token streams are rebuilt
+TOKENS_VERSION = '1'
+
+KEYWORDS = {
+    'abstract', 'as', 'async', 'await', 'break', 'case', 'catch', 'class', 'const', 'continue',
+    'declare', 'default', 'delete', 'do', 'else', 'enum', 'export', 'extends', 'false', 'finally',
+    'for', 'from', 'function', 'get', 'if', 'implements', 'import', 'in', 'instanceof', 'interface',
+    'keyof', 'let', 'new', 'null', 'of', 'private', 'protected', 'public', 'readonly', 'return',
+    'set', 'static', 'super', 'switch', 'this', 'throw', 'true', 'try', 'type', 'typeof',
+    'undefined', 'var', 'void', 'while', 'yield',
+}
+BUILTIN_TYPES = {'any', 'boolean', 'never', 'number', 'object', 'string', 'symbol', 'unknown', 'bigint'}
+
+# Colour, bold and italic per token kind; anything else is drawn as 'plain'
+TOKEN_STYLES = {
+    'plain': (colors.HexColor('#212121'), 0, 0),
+    'keyword': (colors.HexColor('#1565C0'), 1, 0),
+    'string': (colors.HexColor('#2E7D32'), 0, 0),
+    'comment': (colors.HexColor('#757575'), 0, 1),
+    'number': (colors.HexColor('#E65100'), 0, 0),
+    'type': (colors.HexColor('#00838F'), 0, 0),
+    'function': (colors.HexColor('#6A1B9A'), 0, 0),
+    'tag': (colors.HexColor('#C62828'), 0, 0),
+}
+
+_TOKEN_RE = re.compile(r'''
+    (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|$))
+  | (?P<string>`(?:\\[\s\S]|[^`\\])*`?|'(?:\\.|[^'\\\n])*'?|"(?:\\.|[^"\\\n])*"?)
+  | (?P<number>\b(?:0[xXbBoO][\da-fA-F_]+|\d[\d_]*(?:\.\d+)?(?:[eE][+-]?\d+)?)n?\b)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<space>\s+)
+  | (?P<other>.)
+''', re.X)
+
+# snippet hash -> token lines, shared by every document built in this process
+_memory_cache = {}
+
+
+def _kind(word, before, after):
+    if word in KEYWORDS:
+        return 'keyword'
+    if word in BUILTIN_TYPES:
+        return 'type'
+    if before.endswith(('<', '</')) and word[:1].islower() and after[:1] in (' ', '>', '/', '\n', ''):
+        return 'tag'
+    if word[:1].isupper():
+        return 'type'
+    if after.lstrip(' ')[:1] == '(' or after.startswith(('<', '?.(')):
+        return 'function'
+    return 'plain'
+
+
+def tokenize(text):
+    """[[(kind, text), ...] per line]; adjacent tokens of the same kind are merged"""
+    lines = [[]]
+    for match in _TOKEN_RE.finditer(text):
+        group, value = match.lastgroup, match.group()
+        if group == 'word':
+            start, end = match.start(), match.end()
+            group = _kind(value, text[max(0, start - 2):start], text[end:end + 3])
+        elif group in ('space', 'other'):
+            group = 'plain'
+        for i, piece in enumerate(value.split('\n')):
+            if i:
+                lines.append([])
+            if not piece:
+                continue
+            line = lines[-1]
+            if line and line[-1][0] == group:
+                line[-1] = (group, line[-1][1] + piece)
+            else:
+                line.append((group, piece))
+    return lines
+
+
+def tokens(text):
+    """tokenize() through an in-process and an on-disk cache keyed by the snippet's hash"""
+    digest = hashlib.sha256(f"{TOKENS_VERSION}\0{text}".encode('utf-8')).hexdigest()
+    cached = _memory_cache.get(digest)
+    if cached is not None:
+        return cached
+
+    path = os.path.join(CACHE_DIR, digest[:2], digest + '.json')
+    try:
+        with open(path, encoding='utf-8') as f:
+            lines = [[tuple(token) for token in line] for line in json.load(f)]
+    except (OSError, ValueError):
+        lines = tokenize(text)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(lines, f, separators=(',', ':'))
+        os.replace(tmp, path)
+    _memory_cache[digest] = lines
+    return lines
+
+
+class CodeBlock(Flowable):
+    """Highlighted listing that splits between lines when it does not fit a frame
+
+    Font size, leading, background, border, padding and spacing come from a
+    ParagraphStyle such as the generators' code_style.
+    """
+
+    def __init__(self, lines, style, first=True, last=True):
+        Flowable.__init__(self)
+        self.lines = lines
+        self.style = style
+        self.first = first
+        self.last = last
+        self.padding = style.borderPadding or 0
+        if isinstance(self.padding, (list, tuple)):
+            self.padding = self.padding[0]
+
+    def _height(self, count):
+        top = self.padding if self.first else 0
+        bottom = self.padding if self.last else 0
+        return count * self.style.leading + top + bottom
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = self._height(len(self.lines))
+        return self.width, self.height
+
+    def getSpaceBefore(self):
+        return self.style.spaceBefore if self.first else 0
+
+    def getSpaceAfter(self):
+        return self.style.spaceAfter if self.last else 0
+
+    def split(self, availWidth, availHeight):
+        fit = int((availHeight - (self.padding if self.first else 0)) // self.style.leading)
+        # Keep at least two lines on each side rather than leave a lone line behind
+        fit = min(fit, len(self.lines) - 2)
+        if fit < 2:
+            return []
+        return [CodeBlock(self.lines[:fit], self.style, self.first, False),
+                CodeBlock(self.lines[fit:], self.style, False, self.last)]
+
+    def draw(self):
+        canvas = self.canv
+        style = self.style
+        pad = self.padding
+        canvas.saveState()
+
+        # The border box extends padding past the text column, as Preformatted's does
+        x0, x1 = -pad, self.width + pad
+        if style.backColor is not None:
+            canvas.setFillColor(style.backColor)
+            canvas.rect(x0, 0, x1 - x0, self.height, stroke=0, fill=1)
+        if style.borderColor is not None and style.borderWidth:
+            canvas.setStrokeColor(style.borderColor)
+            canvas.setLineWidth(style.borderWidth)
+            canvas.line(x0, 0, x0, self.height)
+            canvas.line(x1, 0, x1, self.height)
+            if self.first:
+                canvas.line(x0, self.height, x1, self.height)
+            if self.last:
+                canvas.line(x0, 0, x1, 0)
+
+        # Faces of the style's font family, e.g. DocMono-Bold for keywords
+        family = ps2tt(style.fontName)[0]
+        text = canvas.beginText()
+        y = self.height - (pad if self.first else 0) - style.fontSize
+        current = None
+        for line in self.lines:
+            text.setTextOrigin(0, y)
+            for kind, value in line:
+                if kind != current:
+                    color, bold, italic = TOKEN_STYLES.get(kind, TOKEN_STYLES['plain'])
+                    text.setFont(tt2ps(family, bold, italic), style.fontSize)
+                    text.setFillColor(color)
+                    current = kind
+                text.textOut(value)
+            y -= style.leading
+        canvas.drawText(text)
+        canvas.restoreState()
+
+
+def code_block(text, style):
+    """A highlighted CodeBlock for a TypeScript/TSX snippet"""
+    return CodeBlock(tokens(text), style)
@@ -0,0 +1,258 @@
+"""
+Jest Result Ingestion
+Streams test results from `jest --json` output or the console log in test_output.txt
+"""
+
+import os
+import re
+from collections import namedtuple
+
+from reportlab.lib import colors
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import LongTable, TableStyle
+
+from docgen import fonts
+from docgen.json_stream import iter_array
+
+# `jest --json --outputFile=jest-results.json` is preferred when present
+RESULTS_PATHS = ('jest-results.json', 'test_output.txt')
+
+# One test: `suite` is the test file, `name` includes its describe blocks
+TestResult = namedtuple('TestResult', 'suite name status duration_ms')
+
+Summary = namedtuple('Summary', 'suites tests snapshots time_s')
+
+# Console markers (Windows consoles print √/×, others ✓/✕)
+_MARKS = {'√': 'passed', '✓': 'passed', '×': 'failed', '✕': 'failed', '○': 'skipped', '✎': 'todo'}
+
+_SUITE_RE = re.compile(r'^(PASS|FAIL)\s+(\S+)')
+_TEST_RE = re.compile(r'^(\s*)([√✓×✕○✎])\s+(?:skipped\s+|todo\s+)?(.*?)(?:\s+\((\d+(?:\.\d+)?)\s*m?s\))?\s*$')
+_COUNTS_RE = re.compile(r'(\d+)\s+(passed|failed|skipped|pending|todo|obsolete|written|total)')
+_TIME_RE = re.compile(r'^Time:\s+([\d.]+)\s*(ms|s)')
+# The dashed rules framing the coverage table Jest prints among the results
+_TABLE_RULE_RE = re.compile(r'^-+(\|-+)+$')
+
+
+class ResultsNotFound(FileNotFoundError):
+    pass
+
+
+def results_path():
+    """The first Jest output that exists; raises ResultsNotFound when there is none"""
+    path = next((p for p in RESULTS_PATHS if os.path.exists(p)), None)
+    if path is None:
+        raise ResultsNotFound(f"no Jest results in {os.getcwd()}: expected {' or '.join(RESULTS_PATHS)}; "
+                              "run `npm run test:json` or `npm test > test_output.txt 2>&1` first")
+    return path
+
+
+def _is_json(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        return f.read(1024).lstrip()[:1] == '{'
+
+
+def iter_results(path=None, totals=None):
+    """Yield a TestResult per test without holding the whole run in memory
+
+    `path` defaults to results_path(). If `totals` is a dict it is filled
+    with the run's summary counters as they are found (the console summary
+    is only known at the end).
+    """
+    path = path or results_path()
+    totals = {} if totals is None else totals
+    if _is_json(path):
+        return _iter_json(path, totals)
+    return _iter_console(path, totals)
+
+
+def _iter_console(path, totals):
+    suite = None
+    describe = []  # (indent, title) of the enclosing describe blocks
+    in_failure = False
+    in_table = False
+
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for raw in f:
+            line = raw.rstrip('\n')
+            stripped = line.strip()
+
+            match = _SUITE_RE.match(line)
+            if match:
+                suite, describe, in_failure = match.group(2), [], False
+                continue
+            if stripped.startswith(('Test Suites:', 'Tests:', 'Snapshots:')):
+                key = stripped.split(':', 1)[0].lower().replace('test suites', 'suites')
+                totals[key] = {k: int(n) for n, k in _COUNTS_RE.findall(stripped)}
+                suite = None
+                continue
+            match = _TIME_RE.match(stripped)
+            if match:
+                value = float(match.group(1))
+                totals['time_s'] = value / 1000 if match.group(2) == 'ms' else value
+                continue
+            if suite is None or not stripped:
+                continue
+            if stripped.startswith('●'):
+                # Failure details follow the suite's test list
+                in_failure = True
+            if _TABLE_RULE_RE.match(stripped):
+                in_table = True
+                continue
+            if in_table and '|' in stripped:
+                continue
+            in_table = False
+            if in_failure:
+                continue
+
+            match = _TEST_RE.match(line)
+            if match:
+                indent, mark, name, duration = match.groups()
+                while describe and describe[-1][0] >= len(indent):
+                    describe.pop()
+                yield TestResult(suite, ' › '.join([t for _, t in describe] + [name]),
+                                 _MARKS[mark], float(duration) if duration else None)
+                continue
+
+            indent = len(line) - len(line.lstrip())
+            while describe and describe[-1][0] >= indent:
+                describe.pop()
+            describe.append((indent, stripped))
+
+
+def _iter_json(path, totals):
+    prefix = []
+    end = None
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for kind, value in iter_array(f, 'testResults'):
+            if kind == 'prefix':
+                prefix.append(value)
+                continue
+            if prefix:
+                _json_totals(''.join(prefix), totals)
+                prefix = []
+            perf = value.get('perfStats') or {}
+            if perf.get('end'):
+                end = max(end or 0, perf['end'])
+            suite = value.get('name', '')
+            if os.path.isabs(suite):
+                suite = os.path.relpath(suite)
+            for a in value.get('assertionResults', ()):
+                name = ' › '.join(list(a.get('ancestorTitles') or ()) + [a.get('title', '')])
+                yield TestResult(suite, name, a.get('status'), a.get('duration'))
+    if prefix:
+        _json_totals(''.join(prefix), totals)
+    start = totals.pop('_start', None)
+    if start is not None and end is not None:
+        totals['time_s'] = (end - start) / 1000
+
+
+def _json_totals(text, totals):
+    fields = dict((k, int(v)) for k, v in re.findall(r'"(num\w+|startTime)"\s*:\s*(\d+)', text))
+    for key, prefix in (('suites', 'TestSuites'), ('tests', 'Tests')):
+        counts = {status: fields.get(f"num{status.title()}{prefix}", 0)
+                  for status in ('passed', 'failed', 'pending', 'todo')}
+        counts['total'] = fields.get(f"numTotal{prefix}", sum(counts.values()))
+        totals[key] = {k: v for k, v in counts.items() if v or k == 'total'}
+    if 'startTime' in fields:
+        totals['_start'] = fields['startTime']
+
+
+def summarize(path=None):
+    """One streaming pass over a run, counting the results if the log has no summary"""
+    totals = {}
+    counted = {}
+    for result in iter_results(path, totals):
+        counted[result.status] = counted.get(result.status, 0) + 1
+    tests = totals.get('tests') or dict(counted, total=sum(counted.values()))
+    return Summary(totals.get('suites', {}), tests, totals.get('snapshots', {'total': 0}), totals.get('time_s'))
+
+
+# Order Jest lists its counters in
+_COUNT_ORDER = ('failed', 'obsolete', 'written', 'skipped', 'pending', 'todo', 'passed')
+
+
+def _counts(counts):
+    parts = [f"{counts[status]} {status}" for status in _COUNT_ORDER if counts.get(status)]
+    return ', '.join(parts + [f"{counts.get('total', 0)} total"])
+
+
+def summary_rows(summary):
+    """[metric, value] rows in Jest's own wording, e.g. ["Tests", "7 passed, 7 total"]"""
+    rows = [
+        ["Test Suites", _counts(summary.suites)],
+        ["Tests", _counts(summary.tests)],
+        ["Snapshots", _counts(summary.snapshots)],
+    ]
+    if summary.time_s is not None:
+        rows.append(["Time", f"{summary.time_s:.2f} s"])
+    return rows
+
+
+def _fit(text, width, font, size):
+    """Trim text with an ellipsis so it fits a column of `width` points"""
+    if stringWidth(text, font, size) <= width:
+        return text
+    # Cut by the average glyph width first, then fine-tune
+    cut = max(1, int(len(text) * width / stringWidth(text, font, size)))
+    while cut > 1 and stringWidth(text[:cut] + '…', font, size) > width:
+        cut -= 1
+    return text[:cut] + '…'
+
+
+STATUS_LABELS = {'passed': 'PASS', 'failed': 'FAIL', 'skipped': 'SKIP', 'pending': 'SKIP', 'todo': 'TODO'}
+
+# ReportLab re-splits the remainder of a table on every page, which is
+# quadratic in its length; long runs are emitted as tables of this many rows
+ROWS_PER_TABLE = 500
+
+
+def _table(rows, failed_rows, col_widths, font, size, padding):
+    style = [
+        ('FONTNAME', (0, 0), (-1, 0), fonts.SANS_BOLD),
+        ('FONTNAME', (0, 1), (-1, -1), font),
+        ('FONTSIZE', (0, 0), (-1, -1), size),
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#424242')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FAFAFA')]),
+        ('TEXTCOLOR', (3, 1), (3, -1), colors.HexColor('#2E7D32')),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#BDBDBD')),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('PADDING', (0, 0), (-1, -1), padding // 2),
+        ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+        ('ALIGN', (3, 0), (-1, -1), 'CENTER'),
+    ]
+    for row in failed_rows:
+        style.append(('BACKGROUND', (3, row), (3, row), colors.HexColor('#FFCDD2')))
+        style.append(('TEXTCOLOR', (3, row), (3, row), colors.HexColor('#C62828')))
+
+    table = LongTable(rows, colWidths=col_widths, repeatRows=1)
+    table.setStyle(TableStyle(style))
+    return table
+
+
+def results_tables(results, header, col_widths, font=None, size=8):
+    """LongTables of #, test, file, status and duration that repeat their header on every page
+
+    Rows are plain strings trimmed to their column and the run is cut into
+    tables of ROWS_PER_TABLE rows, so tens of thousands of tests build in
+    linear time. Returns a list of flowables.
+    """
+    fonts.register()
+    font = font or fonts.SANS
+    padding = 8
+    name_width, file_width = col_widths[1] - padding, col_widths[2] - padding
+    tables = []
+    rows, failed_rows = [header], []
+    for i, result in enumerate(results, start=1):
+        status = STATUS_LABELS.get(result.status, result.status.upper())
+        if status != 'PASS':
+            failed_rows.append(len(rows))
+        duration = f"{result.duration_ms:g} ms" if result.duration_ms is not None else '-'
+        rows.append([str(i), _fit(result.name, name_width, font, size),
+                     _fit(os.path.basename(result.suite), file_width, font, size), status, duration])
+        if len(rows) > ROWS_PER_TABLE:
+            tables.append(_table(rows, failed_rows, col_widths, font, size, padding))
+            rows, failed_rows = [header], []
+    if len(rows) > 1 or not tables:
+        tables.append(_table(rows, failed_rows, col_widths, font, size, padding))
+    return tables
@@ -0,0 +1,88 @@
+"""
+Streaming JSON Reader
+Decodes large JSON reports (jest --json, coverage-summary.json) one member at a time
+instead of loading the whole document
+"""
+
+import json
+
+# Characters read at a time; a value larger than this is read in doubling steps
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = ' \t\r\n'
+
+
+class _Stream:
+    """A text file read in chunks, with a cursor into the current chunk"""
+
+    def __init__(self, f, buf=''):
+        self.f = f
+        self.buf = buf
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+
+    def skip(self, chars):
+        """Move past any of `chars`; returns the next character, or '' at the end"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in chars:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            self.buf, self.pos = self.f.read(CHUNK_SIZE), 0
+            if not self.buf:
+                return ''
+
+    def value(self):
+        """Decode the value at the cursor (an object, array or string; numbers may be cut short)"""
+        size = CHUNK_SIZE
+        while True:
+            try:
+                value, self.pos = self.decoder.raw_decode(self.buf, self.pos)
+                return value
+            except json.JSONDecodeError:
+                chunk = self.f.read(size)
+                if not chunk:
+                    raise
+                # Only the unread part is kept, so memory stays at about one value
+                self.buf, self.pos = self.buf[self.pos:] + chunk, 0
+                size *= 2
+
+
+def iter_object(f):
+    """Yield (key, value) for each member of the JSON object that makes up the file"""
+    stream = _Stream(f)
+    if stream.skip(_WHITESPACE) != '{':
+        raise ValueError('expected a JSON object')
+    stream.pos += 1
+    while stream.skip(_WHITESPACE + ',') not in ('}', ''):
+        key = stream.value()
+        stream.skip(_WHITESPACE + ':')
+        yield key, stream.value()
+
+
+def iter_array(f, key):
+    """Yield ('prefix', text) for the text before the array member `key`, in pieces,
+    then ('item', element) for each element of that array"""
+    marker = f'"{key}"'
+    buf = ''
+    while True:
+        chunk = f.read(CHUNK_SIZE)
+        buf += chunk
+        at = buf.find(marker)
+        if at >= 0:
+            break
+        if not chunk:
+            yield ('prefix', buf)
+            return
+        # Keep enough of the tail to match a marker split across chunks
+        if len(buf) > len(marker):
+            yield ('prefix', buf[:-len(marker)])
+            buf = buf[-len(marker):]
+    yield ('prefix', buf[:at])
+
+    stream = _Stream(f, buf[at + len(marker):])
+    if stream.skip(_WHITESPACE + ':') != '[':
+        return
+    stream.pos += 1
+    while stream.skip(_WHITESPACE + ',') not in (']', ''):
+        yield ('item', stream.value())
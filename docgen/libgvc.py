@@ -0,0 +1,114 @@
+"""
+In-Process Graphviz
+Lays out and renders DOT source through the Graphviz C libraries (libgvc, libcgraph) with
+ctypes, saving the `dot` process spawn and pipe round trip of every diagram
+
+    DOCS_GRAPHVIZ_BACKEND=auto|library|subprocess   (see docgen/render.py)
+
+The libraries are only used when their version matches the `dot` binary's,
+so a render is byte for byte what `dot -T<format>` would produce and the
+render cache stays valid across backends. libgvc is not thread-safe; calls
+are serialised by a lock.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import threading
+
+from docgen import toolchain
+
+_lock = threading.Lock()
+_library = None
+_context = None
+
+
+class LibraryUnavailable(RuntimeError):
+    pass
+
+
+def _load(name, near):
+    """Load lib<name> from the linker path, else from next to the `dot` binary (Windows installs)"""
+    candidates = [ctypes.util.find_library(name)]
+    if near:
+        candidates += [os.path.join(near, f"{name}.dll"), os.path.join(near, f"lib{name}.dll")]
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            return ctypes.CDLL(candidate)
+        except OSError:
+            continue
+    raise LibraryUnavailable(f"lib{name} not found")
+
+
+def _bind():
+    try:
+        near = os.path.dirname(toolchain.dot_path())
+    except toolchain.GraphvizNotFound:
+        near = None
+    cgraph = _load('cgraph', near)
+    gvc = _load('gvc', near)
+
+    cgraph.agmemread.argtypes = [ctypes.c_char_p]
+    cgraph.agmemread.restype = ctypes.c_void_p
+    cgraph.agclose.argtypes = [ctypes.c_void_p]
+    gvc.gvContext.restype = ctypes.c_void_p
+    gvc.gvcVersion.argtypes = [ctypes.c_void_p]
+    gvc.gvcVersion.restype = ctypes.c_char_p
+    gvc.gvLayout.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p]
+    # The length is an unsigned int before Graphviz 3 and a size_t since; a
+    # zeroed size_t reads correctly either way on little-endian machines
+    gvc.gvRenderData.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p,
+                                 ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t)]
+    gvc.gvFreeRenderData.argtypes = [ctypes.c_void_p]
+    gvc.gvFreeLayout.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    return cgraph, gvc
+
+
+def version():
+    """The version of the installed libraries (e.g. '2.43.0'), or None when they do not load"""
+    global _library, _context
+    with _lock:
+        if _library is None:
+            try:
+                _library = _bind()
+            except (LibraryUnavailable, AttributeError):
+                _library = False
+        if not _library:
+            return None
+        if _context is None:
+            _context = _library[1].gvContext()
+        return _library[1].gvcVersion(_context).decode()
+
+
+def available(expected_version):
+    """Whether the libraries load and match `expected_version` (the `dot` binary's, e.g. '2.43.0')"""
+    return version() == expected_version
+
+
+def render(source, fmt, engine='dot'):
+    """Lay out DOT source with `engine` and render it to `fmt`, returning the bytes"""
+    if not _library or _context is None:
+        raise LibraryUnavailable('call available() first')
+    cgraph, gvc = _library
+    data = ctypes.c_void_p()
+    length = ctypes.c_size_t(0)
+    with _lock:
+        graph = cgraph.agmemread(source.encode('utf-8'))
+        if not graph:
+            raise RuntimeError(f"{engine} (in process) could not parse the graph")
+        try:
+            if gvc.gvLayout(_context, graph, engine.encode()) != 0:
+                raise RuntimeError(f"{engine} (in process) layout failed")
+            try:
+                if gvc.gvRenderData(_context, graph, fmt.encode(), ctypes.byref(data), ctypes.byref(length)) != 0:
+                    raise RuntimeError(f"{engine} (in process) cannot render format '{fmt}'")
+                try:
+                    return ctypes.string_at(data, length.value)
+                finally:
+                    gvc.gvFreeRenderData(data)
+            finally:
+                gvc.gvFreeLayout(_context, graph)
+        finally:
+            cgraph.agclose(graph)
@@ -0,0 +1,101 @@
+"""
+Input Manifests for Incremental Builds
+Records the hashes of a document's inputs, and the settings it was built with, next to the output
+so unchanged documents can be skipped
+"""
+
+import hashlib
+import json
+import os
+
+from docgen import toolchain
+
+MANIFEST_SUFFIX = '.manifest.json'
+
+# Settings that change a document without changing any input file (build_docs.py
+# --raster, --graphviz-backend, ... set them); they are recorded under SETTINGS_KEY
+SETTINGS_ENV = ('DOCS_DIAGRAM_MODE', 'DOCS_PRINT_TARGET', 'DOCS_FONTS', 'DOCS_FONT_DIR',
+                'DOCS_GRAPHVIZ_BACKEND', 'DOCS_LAYOUT_BUDGET', 'DOCS_ER_LAYOUT')
+SETTINGS_KEY = ':settings'
+
+
+def manifest_path(output):
+    """`system_architecture.pdf` -> `system_architecture.manifest.json`"""
+    return os.path.splitext(output)[0] + MANIFEST_SUFFIX
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load(output):
+    try:
+        with open(manifest_path(output), encoding='utf-8') as f:
+            return json.load(f).get('inputs', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def settings():
+    """The SETTINGS_ENV values and the `dot` binary (path, size, mtime; it changes with its version)"""
+    values = {name: os.environ.get(name) for name in SETTINGS_ENV}
+    try:
+        dot = toolchain.dot_path()
+        st = os.stat(dot)
+        values['graphviz'] = f"{dot}:{st.st_size}:{st.st_mtime_ns}"
+    except (toolchain.GraphvizNotFound, OSError):
+        values['graphviz'] = None
+    return values
+
+
+def snapshot(inputs, previous=None):
+    """Describe the current state of every input, and of the settings under SETTINGS_KEY
+
+    Files whose size and mtime match `previous` reuse the stored hash instead
+    of being read again. Missing inputs are recorded as None.
+    """
+    previous = previous or {}
+    values = settings()
+    digest = hashlib.sha256(json.dumps(values, sort_keys=True).encode('utf-8')).hexdigest()
+    state = {SETTINGS_KEY: {'values': values, 'sha256': digest}}
+    for path in sorted(set(inputs)):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            state[path] = None
+            continue
+        old = previous.get(path)
+        if old and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+            state[path] = old
+        else:
+            state[path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': file_hash(path)}
+    return state
+
+
+def is_stale(output, state, previous):
+    """True when the output is missing or any input differs from the stored manifest"""
+    if not os.path.exists(output):
+        return True
+    if set(state) != set(previous):
+        return True
+    return any((state[p] or {}).get('sha256') != (previous[p] or {}).get('sha256') for p in state)
+
+
+def save(output, state):
+    path = manifest_path(output)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'output': os.path.basename(output), 'inputs': state}, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def remove(output):
+    """Forget a document's inputs so the next build regenerates it"""
+    try:
+        os.remove(manifest_path(output))
+    except FileNotFoundError:
+        pass
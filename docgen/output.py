@@ -0,0 +1,68 @@
+"""
+Output Locations
+Where documents are published (DOCS_OUTPUT_DIR, default the working directory), a scratch
+directory private to each build for intermediate files, and atomic publishing so readers
+never see a half-written PDF
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+
+
+def output_dir():
+    """Directory documents are published to; read on every call so the build driver can set it"""
+    return os.environ.get('DOCS_OUTPUT_DIR') or '.'
+
+
+def path(name):
+    """Published location of a document declared as OUTPUT = name"""
+    directory = output_dir()
+    return name if directory == '.' else os.path.join(directory, name)
+
+
+def scratch_dir():
+    """Directory for this build's intermediate files
+
+    The build driver creates one per build and hands it to its workers through
+    DOCS_SCRATCH_DIR; a generator run on its own gets a private one that is
+    removed when the process exits.
+    """
+    directory = os.environ.get('DOCS_SCRATCH_DIR')
+    if directory and os.path.isdir(directory):
+        return directory
+    directory = tempfile.mkdtemp(prefix='docs-scratch-')
+    atexit.register(shutil.rmtree, directory, True)
+    os.environ['DOCS_SCRATCH_DIR'] = directory
+    return directory
+
+
+def new_scratch_dir():
+    """Create a scratch directory for one build; the caller removes it with shutil.rmtree"""
+    directory = tempfile.mkdtemp(prefix='docs-scratch-')
+    os.environ['DOCS_SCRATCH_DIR'] = directory
+    return directory
+
+
+def write_atomic(target, data):
+    """Write bytes to `target` through a temporary file in the same directory and a rename"""
+    directory = os.path.dirname(target) or '.'
+    os.makedirs(directory, exist_ok=True)
+    tmp = os.path.join(directory, f".{os.path.basename(target)}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
+    try:
+        with open(tmp, 'xb') as f:
+            f.write(data)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    return target
+
+
+def publish(name, data):
+    """Atomically publish a finished document (e.g. a PDF built into a BytesIO); returns its path"""
+    return write_atomic(path(name), data)
@@ -0,0 +1,276 @@
+"""
+Per-Phase Profiling
+Times the phases of each generator (diagram source, Graphviz, image decode, styles, flowables, build)
+and optionally keeps cProfile stats and tracemalloc snapshots for each of them
+
+    from docgen import phases
+    with phases.profiling(cprofile=True) as report:
+        generate_architecture_pdf.create_pdf()
+    print(phases.summary_table(report))
+
+Profiling is off unless enabled, either through `enable()` / `profiling()` or
+the DOCS_PROFILE environment variable (a comma list of 'times', 'cprofile'
+and 'tracemalloc'), which worker processes inherit.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+PHASES = ('diagram_source', 'graphviz', 'image_decode', 'styles', 'flowables', 'build')
+
+PROFILE_DIR = os.environ.get('DOCS_PROFILE_DIR', 'docs_profile')
+
+REPORT_FILE = 'report.json'
+
+_options = set()
+_local = threading.local()
+_lock = threading.Lock()
+_records = {}
+_profilers = {}
+
+
+class _Frame:
+    """A running phase; time spent in nested phases is not counted twice"""
+
+    def __init__(self, document, phase):
+        self.document = document
+        self.phase = phase
+        self.start = time.perf_counter()
+        self.nested = 0.0
+        self.peak = 0
+
+
+def enable(cprofile=False, tracemalloc_snapshots=False, directory=None):
+    """Start collecting phase timings in this process and any worker it starts"""
+    global PROFILE_DIR
+    _options.clear()
+    _options.add('times')
+    if cprofile:
+        _options.add('cprofile')
+    if tracemalloc_snapshots:
+        _options.add('tracemalloc')
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    if directory:
+        PROFILE_DIR = directory
+    os.environ['DOCS_PROFILE'] = ','.join(sorted(_options))
+    os.environ['DOCS_PROFILE_DIR'] = PROFILE_DIR
+
+
+def disable():
+    _options.clear()
+    os.environ.pop('DOCS_PROFILE', None)
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def enabled():
+    return bool(_options)
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def _push(document, phase):
+    stack = _stack()
+    if stack:
+        parent = stack[-1]
+        _pause(parent)
+        if 'tracemalloc' in _options:
+            parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+    frame = _Frame(document, phase)
+    stack.append(frame)
+    _resume(frame)
+    return frame
+
+
+def _pop():
+    stack = _stack()
+    frame = stack.pop()
+    elapsed = _finish(frame)
+    if stack:
+        stack[-1].nested += elapsed
+        stack[-1].peak = max(stack[-1].peak, frame.peak)
+        _resume(stack[-1])
+
+
+def _finish(frame):
+    """Record a frame's own time and return its total elapsed time"""
+    _pause(frame)
+    elapsed = time.perf_counter() - frame.start
+    if 'tracemalloc' in _options:
+        frame.peak = max(frame.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        _snapshot(frame)
+
+    key = (frame.document, frame.phase)
+    with _lock:
+        record = _records.setdefault(key, {'seconds': 0.0, 'calls': 0, 'peak_kb': 0})
+        record['seconds'] += elapsed - frame.nested
+        record['calls'] += 1
+        record['peak_kb'] = max(record['peak_kb'], frame.peak // 1024)
+    return elapsed
+
+
+def _resume(frame):
+    if 'cprofile' not in _options:
+        return
+    profiler = _profilers.setdefault((frame.document, frame.phase), cProfile.Profile())
+    try:
+        profiler.enable()
+    except ValueError:
+        # Only one profiler can be active at a time; overlapping threads go unprofiled
+        pass
+
+
+def _pause(frame):
+    profiler = _profilers.get((frame.document, frame.phase))
+    if profiler is not None:
+        profiler.disable()
+
+
+def _snapshot(frame):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{frame.document}.{frame.phase}.{os.getpid()}.{time.perf_counter_ns()}.tracemalloc"
+    tracemalloc.take_snapshot().dump(os.path.join(PROFILE_DIR, name))
+
+
+def _document(fn):
+    stack = _stack()
+    if stack:
+        return stack[-1].document
+    return fn.__module__ if fn is not None else 'other'
+
+
+@contextmanager
+def phase(name):
+    """Attribute the enclosed block to a phase of the current document"""
+    if not _options:
+        yield
+        return
+    _push(_document(None), name)
+    try:
+        yield
+    finally:
+        _pop()
+
+
+def timed(name):
+    """Decorator: run a function as `name`, the first phase of its document when outermost"""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _options:
+                return fn(*args, **kwargs)
+            _push(_document(fn), name)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _pop()
+        return wrapper
+    return decorate
+
+
+def switch(name):
+    """End the current phase of a `timed` function and continue it as `name`"""
+    if not _options:
+        return
+    stack = _stack()
+    if not stack:
+        return
+    frame = stack[-1]
+    _finish(frame)
+    stack[-1] = _Frame(frame.document, name)
+    _resume(stack[-1])
+
+
+def drain():
+    """Hand over (and forget) everything recorded in this process
+
+    cProfile stats are written to PROFILE_DIR first, since profilers cannot
+    leave a worker process.
+    """
+    with _lock:
+        records = [dict(document=d, phase=p, **r) for (d, p), r in _records.items()]
+        _records.clear()
+        profilers = dict(_profilers)
+        _profilers.clear()
+    if profilers:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        for (document, name), profiler in profilers.items():
+            profiler.dump_stats(os.path.join(PROFILE_DIR, f"{document}.{name}.{os.getpid()}.prof"))
+    return records
+
+
+def absorb(records):
+    """Add records drained from a worker process to this process's totals"""
+    with _lock:
+        for r in records:
+            record = _records.setdefault((r['document'], r['phase']), {'seconds': 0.0, 'calls': 0, 'peak_kb': 0})
+            record['seconds'] += r['seconds']
+            record['calls'] += r['calls']
+            record['peak_kb'] = max(record['peak_kb'], r['peak_kb'])
+
+
+def report(records):
+    """{'documents': {document: {phase: {...}}}, 'totals': {phase: seconds}}"""
+    documents, totals = {}, {}
+    for r in records:
+        documents.setdefault(r['document'], {})[r['phase']] = {
+            'seconds': round(r['seconds'], 4), 'calls': r['calls'], 'peak_kb': r['peak_kb']}
+        totals[r['phase']] = round(totals.get(r['phase'], 0.0) + r['seconds'], 4)
+    return {'documents': documents, 'totals': totals}
+
+
+def write_report(data, directory=None):
+    directory = directory or PROFILE_DIR
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, REPORT_FILE)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def summary_table(data):
+    """Seconds per document and phase as a fixed-width text table"""
+    columns = [p for p in PHASES if p in data['totals']]
+    columns += sorted(p for p in data['totals'] if p not in PHASES)
+    width = max([len('TOTAL')] + [len(d) for d in data['documents']])
+    lines = ['  '.join([' ' * width] + [f"{p:>14}" for p in columns])]
+    rows = sorted(data['documents'].items())
+    rows.append(('TOTAL', {p: {'seconds': s} for p, s in data['totals'].items()}))
+    for document, phases_ in rows:
+        cells = [f"{phases_[p]['seconds']:13.3f}s" if p in phases_ else f"{'-':>14}" for p in columns]
+        lines.append('  '.join([document.ljust(width)] + cells))
+    return '\n'.join(lines)
+
+
+@contextmanager
+def profiling(cprofile=False, tracemalloc_snapshots=False, directory=None):
+    """Profile the enclosed block; the yielded dict is filled with the report on exit"""
+    enable(cprofile, tracemalloc_snapshots, directory)
+    data = {}
+    try:
+        yield data
+    finally:
+        data.update(report(drain()))
+        disable()
+
+
+def _from_environment():
+    options = {o.strip() for o in os.environ.get('DOCS_PROFILE', '').split(',') if o.strip()}
+    if options:
+        enable('cprofile' in options, 'tracemalloc' in options)
+
+
+_from_environment()
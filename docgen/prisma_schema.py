@@ -0,0 +1,171 @@
+"""
+Prisma Schema Parser
+Builds an in-memory model of prisma/schema.prisma shared by the ER diagram generators
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from collections import namedtuple
+
+SCHEMA_PATH = 'prisma/schema.prisma'
+
+CACHE_DIR = os.path.join(os.environ.get('DOCS_CACHE_DIR', '.docs_cache'), 'schema')
+
+# Bump when the parsed structures change so stale pickles are ignored
+PARSER_VERSION = '1'
+
+Schema = namedtuple('Schema', 'models enums')
+Model = namedtuple('Model', 'name fields indexes uniques')
+Enum = namedtuple('Enum', 'name values')
+Field = namedtuple('Field', 'name type optional is_list is_id is_unique default relation')
+Relation = namedtuple('Relation', 'name fields references')
+
+# A resolved foreign-key relationship: `child.fields` reference `parent`.
+# `label` is the back-reference field on the parent, e.g. User.ledProjects.
+Edge = namedtuple('Edge', 'parent child cardinality label fields')
+
+_BLOCK_RE = re.compile(r'^(model|enum|type|view)\s+(\w+)\s*\{')
+_FIELD_RE = re.compile(r'^(\w+)\s+(\w+)(\[\])?(\?)?\s*(.*)$')
+_LIST_RE = re.compile(r'\[([^\]]*)\]')
+_DEFAULT_RE = re.compile(r'@default\(((?:[^()]|\([^()]*\))*)\)')
+_RELATION_RE = re.compile(r'@relation\(([^)]*)\)')
+
+_memory_cache = {}
+
+
+def _names(text):
+    match = _LIST_RE.search(text)
+    if not match:
+        return ()
+    return tuple(name.strip() for name in match.group(1).split(',') if name.strip())
+
+
+def _parse_relation(attrs):
+    match = _RELATION_RE.search(attrs)
+    if not match:
+        return None
+    args = match.group(1)
+    name = re.search(r'^\s*"([^"]*)"|name:\s*"([^"]*)"', args)
+    fields = re.search(r'fields:\s*(\[[^\]]*\])', args)
+    references = re.search(r'references:\s*(\[[^\]]*\])', args)
+    return Relation(
+        name=(name.group(1) or name.group(2)) if name else None,
+        fields=_names(fields.group(1)) if fields else (),
+        references=_names(references.group(1)) if references else (),
+    )
+
+
+def parse(text):
+    """Parse schema source in one pass over its lines"""
+    models = {}
+    enums = {}
+    kind = name = None
+    fields, block_attrs = [], []
+
+    for raw in text.splitlines():
+        line = raw.split('//', 1)[0].strip()
+        if not line:
+            continue
+
+        if kind is None:
+            match = _BLOCK_RE.match(line)
+            if match:
+                kind, name = match.groups()
+                fields, block_attrs = [], []
+            elif line.endswith('{'):
+                kind = 'other'
+            continue
+
+        if line == '}':
+            if kind == 'model':
+                indexes = [_names(a) for a in block_attrs if a.startswith('@@index')]
+                uniques = [_names(a) for a in block_attrs if a.startswith('@@unique')]
+                models[name] = Model(name, fields, indexes, uniques)
+            elif kind == 'enum':
+                enums[name] = Enum(name, [entry.split()[0] for entry in block_attrs])
+            kind = name = None
+            continue
+
+        if kind == 'enum' or line.startswith('@@'):
+            block_attrs.append(line)
+        elif kind == 'model':
+            match = _FIELD_RE.match(line)
+            if not match:
+                continue
+            field_name, field_type, is_list, optional, attrs = match.groups()
+            tokens = attrs.split()
+            default = _DEFAULT_RE.search(attrs)
+            fields.append(Field(
+                name=field_name,
+                type=field_type,
+                optional=bool(optional),
+                is_list=bool(is_list),
+                is_id='@id' in tokens,
+                is_unique='@unique' in tokens,
+                default=default.group(1) if default else None,
+                relation=_parse_relation(attrs),
+            ))
+
+    return Schema(models, enums)
+
+
+def load_schema(path=SCHEMA_PATH):
+    """Parse a schema file, cached in memory and on disk by the file's hash"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data + PARSER_VERSION.encode()).hexdigest()
+
+    schema = _memory_cache.get(digest)
+    if schema is not None:
+        return schema
+
+    cache_path = os.path.join(CACHE_DIR, digest + '.pickle')
+    try:
+        with open(cache_path, 'rb') as f:
+            schema = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        schema = parse(data.decode('utf-8'))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(schema, f)
+        os.replace(tmp, cache_path)
+
+    _memory_cache[digest] = schema
+    return schema
+
+
+def scalar_fields(model, schema):
+    """Columns of a model: fields that are neither relations nor back-references"""
+    return [f for f in model.fields if f.type not in schema.models]
+
+
+def foreign_keys(model):
+    """Names of the fields that hold a foreign key"""
+    return {name for f in model.fields if f.relation for name in f.relation.fields}
+
+
+def relations(schema):
+    """Every foreign-key relationship in the schema, parent -> child"""
+    # Back-references indexed once: (parent, child, relation name) -> field
+    back_refs = {}
+    for model in schema.models.values():
+        for f in model.fields:
+            if f.type in schema.models and not (f.relation and f.relation.fields):
+                back_refs.setdefault((model.name, f.type, f.relation.name if f.relation else None), f)
+
+    edges = []
+    for child in schema.models.values():
+        unique_sets = {tuple(u) for u in child.uniques}
+        unique_sets.update((f.name,) for f in child.fields if f.is_unique or f.is_id)
+
+        for field in child.fields:
+            if not (field.relation and field.relation.fields) or field.type not in schema.models:
+                continue
+            back = back_refs.get((field.type, child.name, field.relation.name))
+            cardinality = '1:1' if field.relation.fields in unique_sets else '1:N'
+            label = back.name if back else field.name
+            edges.append(Edge(field.type, child.name, cardinality, label, field.relation.fields))
+    return edges
@@ -0,0 +1,209 @@
+"""
+Raster Diagram Sizing and Compression
+Resamples PNG diagrams to the pixel density their placement needs for the print target,
+reduces them to an indexed palette, and embeds the PNG data in the PDF without re-encoding
+
+    DOCS_PRINT_TARGET=screen|ebook|print   (pixels per inch, see PRINT_TARGETS)
+"""
+
+import hashlib
+import io
+import math
+import os
+import struct
+
+from PIL import Image
+from reportlab.pdfbase.pdfdoc import PDFArray, PDFDictionary, PDFName, PDFObject, PDFStream, PDFText
+from reportlab.platypus import Flowable
+
+CACHE_DIR = os.path.join(os.environ.get('DOCS_CACHE_DIR', '.docs_cache'), 'images')
+
+# Bump when the resampling or compression changes so cached images are rebuilt
+IMAGES_VERSION = '1'
+
+# Pixels per inch of the printed placement
+PRINT_TARGETS = {'screen': 96, 'ebook': 150, 'print': 300}
+DEFAULT_TARGET = 'ebook'
+
+# Palette size; the diagrams are flat fills, so only anti-aliased edges lose colours
+PALETTE_COLORS = 256
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# (source hash, pixel size) -> prepared PNG bytes, shared by every document built in this process
+_memory_cache = {}
+
+
+def target_dpi():
+    """Pixels per inch for the print target named by DOCS_PRINT_TARGET"""
+    target = os.environ.get('DOCS_PRINT_TARGET', DEFAULT_TARGET)
+    if target not in PRINT_TARGETS:
+        raise ValueError(f"unknown print target '{target}' (expected one of {', '.join(PRINT_TARGETS)})")
+    return PRINT_TARGETS[target]
+
+
+def _chunks(data):
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError('not a PNG image')
+    offset = len(_PNG_SIGNATURE)
+    while offset + 8 <= len(data):
+        length, kind = struct.unpack_from('>I4s', data, offset)
+        yield kind, data[offset + 8:offset + 8 + length]
+        offset += 12 + length
+
+
+def png_size(data):
+    """(width, height) in pixels from the IHDR header, without decoding the image"""
+    for kind, body in _chunks(data):
+        if kind == b'IHDR':
+            return struct.unpack_from('>II', body)
+    raise ValueError('PNG without an IHDR chunk')
+
+
+def fit(pixels, width, height):
+    """Largest size inside a width x height box with the aspect ratio of `pixels`"""
+    scale = min(width / pixels[0], height / pixels[1])
+    return pixels[0] * scale, pixels[1] * scale
+
+
+def _prepare(data, size):
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    if image.mode in ('RGBA', 'LA', 'P'):
+        # Flatten transparency onto the white page so the result needs no soft mask
+        rgba = image.convert('RGBA')
+        image = Image.new('RGB', rgba.size, 'white')
+        image.paste(rgba, mask=rgba.getchannel('A'))
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    if size != image.size:
+        image = image.resize(size, Image.LANCZOS)
+
+    used = image.getcolors(PALETTE_COLORS)
+    if used is not None:
+        # Few enough colours for an exact (lossless) palette
+        palette = Image.new('P', (1, 1))
+        palette.putpalette([channel for _, rgb in used for channel in rgb])
+        image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+        colours = len(used)
+    else:
+        image = image.quantize(PALETTE_COLORS, method=Image.Quantize.MEDIANCUT, dither=Image.Dither.NONE)
+        colours = len(image.getpalette()) // 3
+    bits = next(b for b in (1, 2, 4, 8) if colours <= 1 << b)
+
+    out = io.BytesIO()
+    image.save(out, 'PNG', optimize=True, bits=bits)
+    return out.getvalue()
+
+
+def prepare(data, width, height):
+    """Resample PNG bytes for a width x height (points) placement
+
+    Returns (png, width, height): an indexed PNG with the pixels the placement
+    needs at the print target's density (never more than the source has), and
+    the placement shrunk to the source's aspect ratio. Results are cached on
+    disk by source hash and pixel size.
+    """
+    source = png_size(data)
+    width, height = fit(source, width, height)
+    dpi = target_dpi()
+    needed = max(1, math.ceil(width / 72 * dpi)), max(1, math.ceil(height / 72 * dpi))
+    # Upsampling adds bytes without adding detail
+    size = needed if needed[0] < source[0] else source
+
+    digest = hashlib.sha256(data).hexdigest()
+    key = (digest, size)
+    cached = _memory_cache.get(key)
+    if cached is not None:
+        return cached, width, height
+
+    path = os.path.join(CACHE_DIR, digest[:2], f"{digest}-{size[0]}x{size[1]}-v{IMAGES_VERSION}.png")
+    try:
+        with open(path, 'rb') as f:
+            png = f.read()
+    except OSError:
+        png = _prepare(data, size)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(png)
+        os.replace(tmp, path)
+    _memory_cache[key] = png
+    return png, width, height
+
+
+class PNGImageXObject(PDFObject):
+    """An image XObject holding a PNG's compressed data as is
+
+    PDF's Flate filter with the PNG predictor reads the IDAT stream directly,
+    so indexed images stay indexed instead of being expanded to RGB the way
+    reportlab's own image objects are.
+    """
+
+    def __init__(self, png):
+        header = palette = None
+        idat = []
+        for kind, body in _chunks(png):
+            if kind == b'IHDR':
+                header = struct.unpack_from('>IIBBBBB', body)
+            elif kind == b'PLTE':
+                palette = body
+            elif kind == b'IDAT':
+                idat.append(body)
+        self.width, self.height, self.bits, color_type, _, _, interlace = header
+        if interlace or color_type not in (0, 2, 3):
+            raise ValueError('only non-interlaced grey, RGB or indexed PNGs can be embedded directly')
+        self.colors = 3 if color_type == 2 else 1
+        if color_type == 3:
+            self.colorSpace = PDFArray([PDFName('Indexed'), PDFName('DeviceRGB'),
+                                        len(palette) // 3 - 1, PDFText(palette)])
+        else:
+            self.colorSpace = PDFName('DeviceRGB' if color_type == 2 else 'DeviceGray')
+        self.content = b''.join(idat)
+
+    def format(self, document):
+        stream = PDFStream(content=self.content)
+        d = stream.dictionary
+        d['Type'] = PDFName('XObject')
+        d['Subtype'] = PDFName('Image')
+        d['Width'] = self.width
+        d['Height'] = self.height
+        d['BitsPerComponent'] = self.bits
+        d['ColorSpace'] = self.colorSpace
+        d['Filter'] = PDFArray([PDFName('FlateDecode')])
+        d['DecodeParms'] = PDFDictionary({'Predictor': 15, 'Colors': self.colors,
+                                          'BitsPerComponent': self.bits, 'Columns': self.width})
+        d['Length'] = len(self.content)
+        return stream.format(document)
+
+
+class RasterDiagram(Flowable):
+    """A prepared PNG drawn at a fixed size; each image is stored once per PDF"""
+
+    def __init__(self, png, width, height):
+        Flowable.__init__(self)
+        self.png = png
+        self.width = width
+        self.height = height
+        self.hAlign = 'CENTER'
+        self.name = 'PNG' + hashlib.sha1(png).hexdigest()
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        document = canvas._doc
+        registered = document.getXObjectName(self.name)
+        if registered not in document.idToObject:
+            document.addForm(self.name, PNGImageXObject(self.png))
+        canvas.saveState()
+        canvas.scale(self.width, self.height)
+        canvas._code.append(f"/{registered} Do")
+        canvas.restoreState()
+        canvas._formsinuse.append(self.name)
+
+
+def raster_flowable(data, width, height):
+    """A RasterDiagram for PNG bytes placed in a width x height box"""
+    return RasterDiagram(*prepare(data, width, height))
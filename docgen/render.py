@@ -0,0 +1,344 @@
+"""
+Graphviz Rendering with a Content-Addressed Cache
+Stores rendered diagrams on disk keyed by DOT source, format, dpi and Graphviz version,
+and bounds every layout by a time budget with cheaper fallbacks
+
+Layouts run in process through libgvc when it is installed (docgen/libgvc.py)
+and through the Graphviz binaries otherwise; DOCS_GRAPHVIZ_BACKEND=subprocess
+or =library forces one of them. An in-process layout cannot be stopped, so
+layouts the budget guards run as `dot` processes unless =library is forced.
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import graphviz
+
+from docgen import draft, libgvc, output, phases, toolchain
+
+CACHE_DIR = os.path.join(os.environ.get('DOCS_CACHE_DIR', '.docs_cache'), 'render')
+
+# Cache entry last rendered for each embedded diagram, by filename; drafts fall back to it
+LAST_DIR = os.path.join(CACHE_DIR, 'last')
+
+# Size cap for the render cache; least recently used entries are evicted first
+CACHE_LIMIT_BYTES = int(os.environ.get('DOCS_RENDER_CACHE_MB', '256')) * 1024 * 1024
+
+VERSION_FILE = 'graphviz_version.json'
+
+# Seconds a single layout attempt may take before the next strategy is tried; 0 for no limit
+LAYOUT_BUDGET = float(os.environ.get('DOCS_LAYOUT_BUDGET', '60'))
+
+# Layout strategies, most faithful first: (name, splines override, engine, unflatten first)
+LAYOUT_STRATEGIES = [
+    ('default', None, None, False),
+    ('polyline', 'polyline', None, False),
+    ('line', 'line', None, False),
+    ('unflatten', 'line', None, True),
+    ('sfdp', 'line', 'sfdp', False),
+]
+
+# 'auto' lays out in process when libgvc matches the `dot` binary, 'library' insists on it,
+# 'subprocess' always runs the binaries
+BACKEND = os.environ.get('DOCS_GRAPHVIZ_BACKEND', 'auto')
+BACKENDS = ('auto', 'library', 'subprocess')
+
+# An in-process layout cannot be interrupted, so under 'auto' with a layout budget
+# only small graphs drawn with these splines run in process; spline and ortho
+# routing (dot's default is spline) can take far longer and run as a process
+# the budget can kill
+LIBRARY_MAX_BYTES = 64 * 1024
+LIBRARY_SPLINES = ('line', 'polyline', 'false', 'none')
+
+# Threads for diagrams rendered while a document's text is laid out (see submit)
+RENDER_THREADS = min(4, os.cpu_count() or 1)
+
+# Which strategy each layout ended up using, appended across builds
+LAYOUT_LOG = os.path.join(os.environ.get('DOCS_CACHE_DIR', '.docs_cache'), 'layouts.log')
+
+# (graph name, strategy, seconds) for every layout run by this process
+layout_log = []
+
+_version = None
+_pool = None
+
+
+def graphviz_version():
+    """Return the installed Graphviz version, probing `dot -V` only when the binary changed"""
+    global _version
+    if _version is not None:
+        return _version
+
+    dot_path = toolchain.dot_path()
+    st = os.stat(dot_path)
+    binary_key = f"{dot_path}:{st.st_size}:{st.st_mtime_ns}"
+
+    version_path = os.path.join(CACHE_DIR, VERSION_FILE)
+    try:
+        with open(version_path, encoding='utf-8') as f:
+            known = json.load(f)
+    except (OSError, ValueError):
+        known = {}
+
+    if known.get('binary') == binary_key:
+        _version = known['version']
+    else:
+        _version = '.'.join(str(part) for part in graphviz.version())
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write_atomic(version_path, json.dumps({'binary': binary_key, 'version': _version}).encode())
+    return _version
+
+
+def cache_key(source, fmt):
+    """Hash everything that influences the rendered bytes"""
+    dpi = re.search(r'\bdpi=["]?([\d.]+)', source)
+    h = hashlib.sha256()
+    for part in (source, fmt, dpi.group(1) if dpi else '', graphviz_version()):
+        h.update(part.encode('utf-8'))
+        h.update(b'\0')
+    return h.hexdigest()
+
+
+class LayoutTimeout(RuntimeError):
+    pass
+
+
+def _use_library(source, budget):
+    if BACKEND not in BACKENDS:
+        raise ValueError(f"unknown Graphviz backend '{BACKEND}' (expected one of {', '.join(BACKENDS)})")
+    if BACKEND == 'subprocess':
+        return False
+    if BACKEND == 'auto' and budget > 0:
+        if len(source) > LIBRARY_MAX_BYTES or _splines(source) not in LIBRARY_SPLINES:
+            return False
+    if libgvc.available(graphviz_version()):
+        return True
+    if BACKEND == 'library':
+        raise libgvc.LibraryUnavailable(f"libgvc {graphviz_version()} (the version of `dot`) is not installed")
+    return False
+
+
+def _run(cmd, data, budget):
+    try:
+        proc = subprocess.run(cmd, input=data, capture_output=True, timeout=budget if budget > 0 else None)
+    except subprocess.TimeoutExpired:
+        raise LayoutTimeout(f"{cmd[0]} exceeded {budget:g}s")
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed: {proc.stderr.decode(errors='replace').strip()}")
+    return proc.stdout
+
+
+def _splines(source):
+    """The splines value the DOT source sets for the graph, or None"""
+    match = re.search(r'\bsplines=("?)(\w+)\1', source)
+    return match.group(2) if match else None
+
+
+def _with_splines(source, splines):
+    """Override the splines attribute in the DOT source (file values beat -G defaults)"""
+    if re.search(r'\bsplines=', source):
+        return re.sub(r'\bsplines=("?)\w+\1', f'splines={splines}', source)
+    return source
+
+
+@phases.timed('graphviz')
+def layout(source, fmt, engine='dot', budget=None, name='graph'):
+    """Run Graphviz on DOT source, falling back to cheaper layouts when over budget"""
+    budget = LAYOUT_BUDGET if budget is None else budget
+    current = _splines(source)
+    for strategy, splines, fallback_engine, unflatten in LAYOUT_STRATEGIES:
+        if strategy != 'default' and splines == current and not (fallback_engine or unflatten):
+            # The graph already uses these splines; this would repeat the layout that timed out
+            continue
+        text = _with_splines(source, splines) if splines else source
+        cmd = [fallback_engine or engine, f'-T{fmt}']
+        if splines:
+            cmd.append(f'-Gsplines={splines}')
+
+        start = time.perf_counter()
+        backend = 'subprocess'
+        try:
+            if strategy == 'default' and _use_library(text, budget):
+                # No -G overrides or unflatten pass, so the libraries produce what `dot` would
+                backend = 'library'
+                data = libgvc.render(text, fmt, engine)
+            else:
+                data = text.encode('utf-8')
+                if unflatten:
+                    # Staggers wide fan-out nodes (like User) over several ranks
+                    data = _run(['unflatten', '-l', '3', '-f', '-c', '4'], data, budget)
+                data = _run(cmd, data, budget)
+        except LayoutTimeout as e:
+            print(f"  layout '{name}' ({strategy}): {e}, trying a cheaper layout", file=sys.stderr)
+            continue
+        except FileNotFoundError as e:
+            # unflatten or sfdp may be missing from minimal Graphviz installs
+            print(f"  layout '{name}' ({strategy}): {e.filename} not found, skipping", file=sys.stderr)
+            continue
+
+        elapsed = time.perf_counter() - start
+        layout_log.append((name, strategy, elapsed))
+        _log_layout(name, fmt, strategy, backend, elapsed)
+        if strategy != 'default':
+            print(f"  layout '{name}' rendered with the '{strategy}' fallback", file=sys.stderr)
+        return data
+
+    raise LayoutTimeout(f"every layout strategy for '{name}' exceeded {budget:g}s")
+
+
+def _log_layout(name, fmt, strategy, backend, elapsed):
+    os.makedirs(os.path.dirname(LAYOUT_LOG), exist_ok=True)
+    with open(LAYOUT_LOG, 'a', encoding='utf-8') as f:
+        f.write(f"{time.strftime('%Y-%m-%dT%H:%M:%S')}\t{name}\t{fmt}\t{strategy}\t{backend}\t{elapsed:.2f}s\n")
+
+
+def render_bytes(dot, budget=None):
+    """Return the rendered bytes of a Digraph, reusing a cached result when possible"""
+    fmt = dot.format
+    entry = os.path.join(CACHE_DIR, f"{cache_key(dot.source, fmt)}.{fmt}")
+
+    try:
+        # Touch the entry so eviction treats it as recently used
+        os.utime(entry)
+        with open(entry, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        # Not rendered yet, or evicted by another build meanwhile
+        pass
+
+    # Keyed by the original source, so a fallback result is reused instead of
+    # hitting the budget again on the next build
+    data = layout(dot.source, fmt, engine=dot.engine, budget=budget, name=dot.name)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _write_atomic(entry, data)
+    evict()
+    return data
+
+
+def render(dot, filename, budget=None):
+    """Render a Digraph to `<filename>.<format>` (written atomically) and return the path
+
+    Drafts can reuse the render through draft_render(dot, basename of `filename`).
+    """
+    path = output.write_atomic(f"{filename}.{dot.format}", render_bytes(dot, budget))
+    _remember(os.path.basename(filename), dot.format, f"{cache_key(dot.source, dot.format)}.{dot.format}")
+    return path
+
+
+def render_diagram(dot, filename, budget=None):
+    """Render a Digraph that will be embedded in a PDF
+
+    By default the bytes stay in memory and a BytesIO is returned, so nothing
+    is written to disk. DOCS_DIAGRAM_IO=file writes `<filename>.<format>` into
+    the build's scratch directory instead and returns its path. Drafts never
+    run Graphviz (see draft_render).
+    """
+    if draft.enabled():
+        return draft_render(dot, filename)
+    entry = f"{cache_key(dot.source, dot.format)}.{dot.format}"
+    if os.environ.get('DOCS_DIAGRAM_IO', 'memory') == 'file':
+        result = render(dot, os.path.join(output.scratch_dir(), filename), budget)
+    else:
+        result = io.BytesIO(render_bytes(dot, budget))
+    _remember(filename, dot.format, entry)
+    return result
+
+
+def _remember(filename, fmt, entry):
+    path = os.path.join(LAST_DIR, f"{filename}.{fmt}")
+    try:
+        with open(path, encoding='utf-8') as f:
+            if f.read() == entry:
+                return
+    except OSError:
+        pass
+    os.makedirs(LAST_DIR, exist_ok=True)
+    _write_atomic(path, entry.encode('utf-8'))
+
+
+def draft_render(dot, filename):
+    """The cached render of a Digraph, else the last one rendered under `filename`, else empty
+
+    Returns a BytesIO named after `filename` for draft.placeholder; only the
+    header of the render is ever read. Graphviz need not be installed.
+    """
+    candidates = []
+    try:
+        candidates.append(f"{cache_key(dot.source, dot.format)}.{dot.format}")
+    except toolchain.GraphvizNotFound:
+        pass
+    try:
+        with open(os.path.join(LAST_DIR, f"{filename}.{dot.format}"), encoding='utf-8') as f:
+            candidates.append(f.read())
+    except OSError:
+        pass
+    data = b''
+    for entry in candidates:
+        try:
+            with open(os.path.join(CACHE_DIR, entry), 'rb') as f:
+                data = f.read()
+            break
+        except OSError:
+            continue
+    result = io.BytesIO(data)
+    result.name = filename
+    return result
+
+
+def submit(fn, *args, **kwargs):
+    """Start a diagram render (e.g. diagrams.render) on a background thread; returns its Future
+
+    Renders mostly wait on Graphviz, a subprocess or a libgvc call that
+    releases the GIL, so the caller can build its text flowables meanwhile.
+    embed.diagram_flowable accepts the Future and only waits for it when
+    the page holding the diagram is laid out.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ThreadPoolExecutor(max_workers=RENDER_THREADS, thread_name_prefix='render')
+    return _pool.submit(fn, *args, **kwargs)
+
+
+def discard(*diagrams):
+    """Remove intermediate diagram files; in-memory diagrams need no cleanup"""
+    for diagram in diagrams:
+        if isinstance(diagram, str) and os.path.exists(diagram):
+            os.remove(diagram)
+
+
+def evict(limit=CACHE_LIMIT_BYTES):
+    """Delete least recently used cache entries until the cache fits in `limit` bytes"""
+    entries = []
+    total = 0
+    with os.scandir(CACHE_DIR) as it:
+        for e in it:
+            if e.name == VERSION_FILE or not e.is_file():
+                continue
+            st = e.stat()
+            entries.append((st.st_mtime, st.st_size, e.path))
+            total += st.st_size
+
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _write_atomic(path, data):
+    # Render threads of one process may write the same entry
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
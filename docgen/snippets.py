@@ -0,0 +1,273 @@
+"""
+Source Snippet Extraction
+Resolves code references like ('src/services/TaskService.ts', 'TaskService.changeTaskStatus')
+through an index of symbol spans built once per file and cached by mtime and hash
+"""
+
+import hashlib
+import json
+import os
+import re
+import textwrap
+
+CACHE_DIR = os.path.join(os.environ.get('DOCS_CACHE_DIR', '.docs_cache'), 'snippets')
+
+# Bump when the scanner changes so cached indexes are rebuilt
+INDEX_VERSION = '1'
+
+_DECLARATIONS = [
+    ('class', re.compile(r'^(?:export\s+)?(?:default\s+)?(?:abstract\s+)?class\s+(\w+)')),
+    ('function', re.compile(r'^(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(\w+)')),
+    ('type', re.compile(r'^(?:export\s+)?(?:declare\s+)?(?:interface|type|enum)\s+(\w+)')),
+    ('const', re.compile(r'^(?:export\s+)?(?:const|let|var)\s+(\w+)')),
+]
+_METHOD_RE = re.compile(
+    r'^(?:(?:public|private|protected|static|readonly|override|async|get|set)\s+)*\*?(\w+)\s*(?:<[^>]*>)?\s*(\(|=\s*(?:async\s*)?\()')
+_TEST_RE = re.compile(r'^(describe|it|test)(?:\.\w+)*\s*\(\s*([\'"`])(.*?)\2')
+_NOT_METHODS = {'if', 'for', 'while', 'switch', 'catch', 'return', 'await', 'function'}
+
+# A statement continues on the next line after these
+_CONTINUES = tuple('=,(+-*/?:&|.[{<>')
+
+# Characters after which a `/` starts a regular expression rather than a division
+_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^') | {''}
+
+# path -> (mtime_ns, size, lines, symbols)
+_memory_cache = {}
+
+
+def _scan(text):
+    """Return {name: [first_line, last_line, kind]} for the symbols in TS/TSX source
+
+    Lines are 1-based and inclusive. Methods and nested declarations are
+    qualified with their parents ('TaskService.changeTaskStatus'); test blocks
+    with their describe blocks ('AuthService > hashPassword > should ...').
+    """
+    symbols = {}
+    open_symbols = []  # [name, kind, start, depth, is_test, body_depth]
+    brackets = []      # (char, owner) where owner is the symbol whose body the bracket opens
+    mode = None        # None, a quote character, '`', or '*' inside a block comment
+    templates = []     # bracket depth of each `${` still open inside template literals
+    ending = None      # symbol whose last line may be the previous one, unless the statement continues
+
+    for number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+
+        if ending is not None:
+            continued = stripped[:1] in ('.', '?', ':') or stripped.startswith(('&&', '||'))
+            if not continued:
+                _close(ending, number - 1, symbols, open_symbols)
+            ending = None
+
+        if mode is None and stripped:
+            _declare(stripped, number, brackets, open_symbols)
+
+        prev = ''
+        i = 0
+        while i < len(line):
+            c = line[i]
+            if mode == '*':
+                if line.startswith('*/', i):
+                    mode, i = None, i + 2
+                    continue
+            elif mode in ('"', "'"):
+                if c == '\\':
+                    i += 1
+                elif c == mode:
+                    mode = None
+            elif mode == '`':
+                if c == '\\':
+                    i += 1
+                elif c == '`':
+                    mode = None
+                elif line.startswith('${', i):
+                    mode = None
+                    templates.append(len(brackets))
+                    brackets.append(('{', None))
+                    i += 1
+            elif c in '"\'`':
+                mode = c
+            elif line.startswith('//', i):
+                break
+            elif line.startswith('/*', i):
+                mode, i = '*', i + 1
+            elif c == '/' and prev in _REGEX_AFTER:
+                i = _skip_regex(line, i)
+            elif c in '([{':
+                owner = None
+                if open_symbols and open_symbols[-1][5] is None and c == '{' and len(brackets) == open_symbols[-1][3]:
+                    owner = open_symbols[-1]
+                    owner[5] = len(brackets) + 1
+                brackets.append((c, owner))
+            elif c in ')]}':
+                if brackets:
+                    brackets.pop()
+                if templates and templates[-1] == len(brackets):
+                    templates.pop()
+                    mode = '`'
+            if not c.isspace():
+                prev = c if not c.isalnum() else 'a'
+            i += 1
+
+        if mode in ('"', "'"):
+            # Quotes never span lines; an unmatched one (e.g. JSX text) ends here
+            mode = None
+
+        if open_symbols and mode is None:
+            top = open_symbols[-1]
+            if len(brackets) <= top[3] and stripped and not stripped.endswith(_CONTINUES):
+                ending = top
+            elif len(brackets) < top[3]:
+                _close(top, number, symbols, open_symbols)
+
+    if ending is not None:
+        _close(ending, len(text.splitlines()), symbols, open_symbols)
+    while open_symbols:
+        _close(open_symbols[-1], len(text.splitlines()), symbols, open_symbols)
+    return symbols
+
+
+def _skip_regex(line, i):
+    in_class = False
+    j = i + 1
+    while j < len(line):
+        c = line[j]
+        if c == '\\':
+            j += 1
+        elif c == '[':
+            in_class = True
+        elif c == ']':
+            in_class = False
+        elif c == '/' and not in_class:
+            return j
+        j += 1
+    return i
+
+
+def _declare(stripped, number, brackets, open_symbols):
+    """Open a symbol if the line starts a declaration at a place where one can appear"""
+    parent = open_symbols[-1] if open_symbols else None
+    in_class_body = (parent is not None and parent[1] == 'class'
+                     and parent[5] is not None and len(brackets) == parent[5])
+
+    name = kind = None
+    match = _TEST_RE.match(stripped)
+    if match:
+        kind, name = 'test', match.group(3)
+    elif in_class_body:
+        match = _METHOD_RE.match(stripped)
+        if match and match.group(1) not in _NOT_METHODS:
+            kind, name = 'method', match.group(1)
+    else:
+        for decl_kind, pattern in _DECLARATIONS:
+            match = pattern.match(stripped)
+            if match:
+                kind, name = decl_kind, match.group(1)
+                break
+    if name is None:
+        return
+
+    parents = [s for s in open_symbols if s[4] == (kind == 'test')]
+    separator = ' > ' if kind == 'test' else '.'
+    qualified = f"{parents[-1][0]}{separator}{name}" if parents else name
+    open_symbols.append([qualified, kind, number, len(brackets), kind == 'test', None])
+
+
+def _close(symbol, last, symbols, open_symbols):
+    while open_symbols:
+        top = open_symbols.pop()
+        symbols.setdefault(top[0], [top[2], max(last, top[2]), top[1]])
+        if top is symbol:
+            break
+
+
+def index(path):
+    """Return (lines, symbols) for a source file
+
+    Unchanged files (same mtime and size) reuse the cached index without
+    being hashed or scanned; a touched file is hashed and only re-scanned
+    when its content changed.
+    """
+    st = os.stat(path)
+    cached = _memory_cache.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2], cached[3]
+
+    entry_path = os.path.join(CACHE_DIR, hashlib.sha1(os.path.abspath(path).encode()).hexdigest() + '.json')
+    try:
+        with open(entry_path, encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        entry = {}
+
+    with open(path, 'rb') as f:
+        data = f.read()
+    fresh = (entry.get('version') == INDEX_VERSION and entry.get('mtime_ns') == st.st_mtime_ns
+             and entry.get('size') == st.st_size)
+    if fresh:
+        symbols = entry['symbols']
+    else:
+        digest = hashlib.sha256(data).hexdigest()
+        if entry.get('version') == INDEX_VERSION and entry.get('sha256') == digest:
+            symbols = entry['symbols']
+        else:
+            symbols = _scan(data.decode('utf-8'))
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{entry_path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'path': path, 'version': INDEX_VERSION, 'mtime_ns': st.st_mtime_ns,
+                       'size': st.st_size, 'sha256': digest, 'symbols': symbols}, f)
+        os.replace(tmp, entry_path)
+
+    lines = data.decode('utf-8').splitlines()
+    _memory_cache[path] = (st.st_mtime_ns, st.st_size, lines, symbols)
+    return lines, symbols
+
+
+def _outline(lines, symbols, name):
+    """A class with its method bodies elided: `login(...) { /* ... */ }`"""
+    start, end, _ = symbols[name]
+    out = []
+    for i in range(start - 1, end):
+        out.append(lines[i])
+        if lines[i].rstrip().endswith('{'):
+            break
+    members = sorted((span for member, span in symbols.items()
+                      if member.startswith(name + '.') and '.' not in member[len(name) + 1:]
+                      and span[2] == 'method'), key=lambda span: span[0])
+    for first, last, _ in members:
+        parens = 0  # the body's `{` is the first one outside the parameter list
+        for i in range(first - 1, last):
+            text = lines[i].rstrip()
+            parens += text.count('(') - text.count(')')
+            if text.endswith('{') and parens <= 0:
+                out.append(text + ' /* ... */ }')
+                break
+            out.append(text)
+    out.append(lines[end - 1])
+    return out
+
+
+def snippet(path, *names, outline=False):
+    """Source text of one or more symbols in a file, dedented and joined by blank lines
+
+    With no names the whole file is returned. `outline` shows classes with
+    their method bodies elided.
+    """
+    lines, symbols = index(path)
+    if not names:
+        return '\n'.join(lines).strip('\n')
+
+    parts = []
+    for name in names:
+        if name not in symbols:
+            close = [s for s in symbols if s.split('.')[-1] == name.split('.')[-1]]
+            hint = f" (did you mean {', '.join(close)}?)" if close else ''
+            raise LookupError(f"{path}: no symbol '{name}'{hint}")
+        start, end, kind = symbols[name]
+        if outline and kind == 'class':
+            chunk = _outline(lines, symbols, name)
+        else:
+            chunk = lines[start - 1:end]
+        parts.append(textwrap.dedent('\n'.join(chunk)))
+    return '\n\n'.join(parts)
@@ -0,0 +1,42 @@
+"""
+Graphviz Binary Lookup
+Finds the Graphviz `dot` binary once per process, putting the default Windows install
+directory on PATH when Graphviz is installed there but not on PATH
+"""
+
+import os
+import shutil
+
+# Searched, in order, when `dot` is not on PATH
+INSTALL_DIRS = [r"C:\Program Files\Graphviz\bin"]
+
+_dot = None
+
+
+class GraphvizNotFound(RuntimeError):
+    pass
+
+
+def dot_path():
+    """Path of the `dot` binary
+
+    The first call searches PATH and INSTALL_DIRS, and extends PATH (which
+    worker processes and the other Graphviz tools then inherit) with the
+    install directory it was found in; later calls return the same path.
+    """
+    global _dot
+    if _dot is not None:
+        return _dot
+
+    found = shutil.which('dot')
+    if not found:
+        for directory in INSTALL_DIRS:
+            found = shutil.which('dot', path=directory)
+            if found:
+                os.environ['PATH'] = directory + os.pathsep + os.environ.get('PATH', '')
+                break
+    if not found:
+        raise GraphvizNotFound("Graphviz 'dot' was not found on PATH or in "
+                               f"{', '.join(INSTALL_DIRS)}; install it from https://graphviz.org/download/")
+    _dot = found
+    return _dot
@@ -0,0 +1,202 @@
+"""
+Watch Mode
+Rebuilds the documents affected by each change, as reported by inotify, in one warm
+process that keeps reportlab, graphviz and the generators imported
+
+    python build_docs.py --watch
+"""
+
+import ctypes
+import ctypes.util
+import importlib
+import os
+import select
+import shutil
+import struct
+import sys
+import time
+import traceback
+
+from docgen import build, output
+
+# Changes closer together than this are rebuilt as one batch (an editor's
+# save, or Jest rewriting test_output.txt, is several events)
+SETTLE_SECONDS = 0.05
+
+# Directories watched besides the ones holding declared inputs; src/ is watched recursively
+WATCH_DIRS = ['.', 'docgen', 'prisma', 'coverage']
+RECURSIVE_DIRS = ['src']
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_IGNORED = 0x00008000
+_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT = struct.Struct('iIII')
+
+
+class Inotify:
+    """Minimal inotify(7) binding: directory watches and a blocking read of changed paths"""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library('c')
+        self._libc = ctypes.CDLL(libc_name or 'libc.so.6', use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError('inotify is not available on this platform')
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._dirs = {}
+
+    def add(self, directory, recursive=False):
+        if not os.path.isdir(directory):
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), _MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'cannot watch {directory}')
+        self._dirs[wd] = (directory, recursive)
+        if recursive:
+            for entry in os.scandir(directory):
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                    self.add(entry.path, recursive=True)
+
+    def read(self, timeout=None):
+        """Paths changed since the last read, waiting up to `timeout` seconds (forever if None)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if wd not in self._dirs:
+                continue
+            directory, recursive = self._dirs[wd]
+            path = os.path.normpath(os.path.join(directory, os.fsdecode(name)))
+            if mask & IN_ISDIR:
+                if recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    self.add(path, recursive=True)
+                continue
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def affected(targets, changed):
+    """Targets with at least one changed input"""
+    changed = {os.path.normpath(p) for p in changed}
+    return [t for t in targets if changed.intersection(os.path.normpath(p) for p in t.inputs)]
+
+
+def warm_up(targets):
+    """Import every generator (and with them reportlab and graphviz) before the first change"""
+    for target in targets:
+        try:
+            importlib.import_module(target.module)
+        except Exception as e:
+            print(f"  cannot import {target.module}: {e}", file=sys.stderr)
+
+
+def rebuild(targets):
+    """Build the stale targets one after another in this process; returns the modules that failed"""
+    stale, _, snapshots = build.stale_targets(targets)
+    failed = set()
+    for target in stale:
+        start = time.perf_counter()
+        try:
+            kwargs = {param: build.run_node(module, function, dict(node_kwargs))[0]
+                      for param, (module, function, node_kwargs) in target.diagrams}
+            build.run_node(target.module, target.function, kwargs)
+        except Exception:
+            traceback.print_exc()
+            print(f"FAILED {target.module}", file=sys.stderr)
+            failed.add(target.module)
+            continue
+        if target.module in snapshots:
+            build.record(target, snapshots[target.module])
+        print(f"  {time.perf_counter() - start:7.2f}s  {target.output or target.module}")
+    return failed
+
+
+def _restart(scratch):
+    # docgen itself changed; modules holding its state cannot be reloaded safely
+    print("docgen changed, restarting watcher")
+    sys.stdout.flush()
+    shutil.rmtree(scratch, ignore_errors=True)
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+
+def run(targets, wanted=None):
+    """Build what is stale, then rebuild affected documents on every change until interrupted"""
+    try:
+        inotify = Inotify()
+    except OSError as e:
+        print(f"Watch mode needs Linux inotify: {e}", file=sys.stderr)
+        return 1
+
+    directories = set(WATCH_DIRS)
+    for target in targets:
+        for path in target.inputs:
+            directories.add(os.path.dirname(path) or '.')
+    for directory in sorted(directories):
+        inotify.add(directory)
+    for directory in RECURSIVE_DIRS:
+        inotify.add(directory, recursive=True)
+
+    scratch = output.new_scratch_dir()
+    warm_up(targets)
+    rebuild(targets)
+    print(f"Watching {len(targets)} documents for changes (Ctrl+C to stop)")
+
+    try:
+        while True:
+            changed = inotify.read()
+            while True:
+                more = inotify.read(SETTLE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+
+            relative = {os.path.relpath(p) for p in changed}
+            if any(p.startswith('docgen' + os.sep) and p.endswith('.py') for p in relative):
+                inotify.close()
+                _restart(scratch)
+
+            scripts = {p for p in relative if p.startswith('generate_') and p.endswith('.py')}
+            if scripts:
+                # A generator may have changed its INPUTS; reload it before rebuilding
+                targets = [t for t in build.discover() if wanted is None or t.module in wanted]
+                for path in scripts:
+                    module = sys.modules.get(os.path.splitext(path)[0])
+                    if module is None:
+                        continue
+                    try:
+                        importlib.reload(module)
+                    except Exception:
+                        traceback.print_exc()
+
+            todo = affected(targets, relative)
+            if not todo:
+                continue
+            start = time.perf_counter()
+            print(f"Changed: {', '.join(sorted(relative))}")
+            failed = rebuild(todo)
+            print(f"Rebuilt {len(todo) - len(failed)}/{len(todo)} documents "
+                  f"in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        inotify.close()
+        shutil.rmtree(scratch, ignore_errors=True)
@@ -3,312 +3,218 @@ ER Diagram Generator for Project Management System
 Generates a PDF containing the Entity-Relationship diagram based on Prisma schema
 """
 
+import io
 import os
-import sys
 
-# Add Graphviz to PATH on Windows
-graphviz_path = r"C:\Program Files\Graphviz\bin"
-if os.path.exists(graphviz_path):
-    os.environ["PATH"] = graphviz_path + os.pathsep + os.environ.get("PATH", "")
+from concurrent.futures import ThreadPoolExecutor
 
 from graphviz import Digraph
-
-def create_er_diagram():
-    # Create a new directed graph with specific settings for ER diagrams
-    dot = Digraph('ER_Diagram', format='pdf')
+from reportlab.lib.pagesizes import A3, landscape
+from reportlab.lib.units import cm
+from reportlab.platypus import SimpleDocTemplate, Paragraph, PageBreak
+
+from docgen import draft, fonts, output, phases
+from docgen.embed import diagram_flowable, embed_format
+from docgen.er_shards import cross_links, shard_models
+from docgen.prisma_schema import foreign_keys, load_schema, relations, scalar_fields
+from docgen.render import discard, draft_render, render, render_diagram
+
+# Output document and the files it is generated from (read by docgen/build.py)
+OUTPUT = 'er_diagram.pdf'
+INPUTS = ['prisma/schema.prisma']
+
+# (background, header) colours per entity; models not listed use DEFAULT_COLORS
+ENTITY_COLORS = {
+    'User': ('#E8F4FD', '#2196F3'),
+    'Session': ('#FFF3E0', '#FF9800'),
+    'Project': ('#E8F5E9', '#4CAF50'),
+    'ProjectUser': ('#FCE4EC', '#E91E63'),
+    'Task': ('#F3E5F5', '#9C27B0'),
+    'TaskHistory': ('#EDE7F6', '#673AB7'),
+    'File': ('#E0F7FA', '#00BCD4'),
+    'Comment': ('#E0F2F1', '#009688'),
+    'ActivityLog': ('#ECEFF1', '#607D8B'),
+    'Notification': ('#FFF8E1', '#FFC107'),
+    'Course': ('#FFEBEE', '#F44336'),
+    'CourseEnrollment': ('#FFCDD2', '#D32F2F'),
+    'ProjectGrade': ('#C8E6C9', '#388E3C'),
+    'FinalSubmission': ('#DCEDC8', '#689F38'),
+    'FinalSubmissionFile': ('#F0F4C3', '#AFB42B'),
+    'ProjectReview': ('#B2DFDB', '#00796B'),
+    'Announcement': ('#B3E5FC', '#0288D1'),
+}
+DEFAULT_COLORS = ('#F5F5F5', '#757575')
+
+# Schemas with more models than this get one page per domain shard
+# (DOCS_ER_LAYOUT=single|sharded overrides the automatic choice)
+SHARD_THRESHOLD = 40
+
+
+def field_description(field, fks):
+    """Type column of an entity table, e.g. 'UUID (PK)', 'UUID? (FK)', 'String (unique)'"""
+    optional = '?' if field.optional else ''
+    if field.is_id:
+        return 'UUID (PK)' if field.default == 'uuid()' else f"{field.type} (PK)"
+    if field.name in fks:
+        return f"UUID{optional} (FK, unique)" if field.is_unique else f"UUID{optional} (FK)"
+    if field.is_unique:
+        return f"{field.type}{optional} (unique)"
+    return f"{field.type}{optional}"
+
+
+def entity_label(model, schema):
+    """HTML-like table label listing every column of a model"""
+    bgcolor, header = ENTITY_COLORS.get(model.name, DEFAULT_COLORS)
+    fks = foreign_keys(model)
+    rows = []
+    for field in scalar_fields(model, schema):
+        name = f"<U>{field.name}</U>" if field.is_id else field.name
+        rows.append(f'''
+                <TR><TD ALIGN="LEFT">{name}</TD><TD ALIGN="LEFT">{field_description(field, fks)}</TD></TR>''')
+    return f'''<
+            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="{bgcolor}">
+                <TR><TD COLSPAN="2" BGCOLOR="{header}"><FONT COLOR="white"><B>{model.name}</B></FONT></TD></TR>{''.join(rows)}
+            </TABLE>>'''
+
+
+def new_er_graph(name, fmt):
+    """Digraph with the settings shared by every ER layout"""
+    dot = Digraph(name, format=fmt)
     dot.attr(rankdir='TB', splines='ortho', nodesep='0.8', ranksep='1.2')
     dot.attr('node', shape='none', fontname='Arial', fontsize='10')
     dot.attr('edge', fontname='Arial', fontsize='9')
+    return dot
+
 
-    # Define entity tables using HTML-like labels
-    entities = {
-        'User': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#E8F4FD">
-                <TR><TD COLSPAN="2" BGCOLOR="#2196F3"><FONT COLOR="white"><B>User</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">email</TD><TD ALIGN="LEFT">String (unique)</TD></TR>
-                <TR><TD ALIGN="LEFT">passwordHash</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">fullName</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">role</TD><TD ALIGN="LEFT">UserRole</TD></TR>
-                <TR><TD ALIGN="LEFT">avatarUrl</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">isActive</TD><TD ALIGN="LEFT">Boolean</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">lastLoginAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-                <TR><TD ALIGN="LEFT">deletedAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-            </TABLE>>''',
-
-        'Session': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#FFF3E0">
-                <TR><TD COLSPAN="2" BGCOLOR="#FF9800"><FONT COLOR="white"><B>Session</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">userId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">userAgent</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">ip</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">expiresAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">revoked</TD><TD ALIGN="LEFT">Boolean</TD></TR>
-            </TABLE>>''',
-
-        'Project': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#E8F5E9">
-                <TR><TD COLSPAN="2" BGCOLOR="#4CAF50"><FONT COLOR="white"><B>Project</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">title</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">description</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">courseCode</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">courseId</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">projectType</TD><TD ALIGN="LEFT">ProjectType</TD></TR>
-                <TR><TD ALIGN="LEFT">teamLeaderId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">status</TD><TD ALIGN="LEFT">ProjectStatus</TD></TR>
-                <TR><TD ALIGN="LEFT">deadlineDate</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">deletedAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-            </TABLE>>''',
-
-        'ProjectUser': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#FCE4EC">
-                <TR><TD COLSPAN="2" BGCOLOR="#E91E63"><FONT COLOR="white"><B>ProjectUser</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">projectId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">userId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">role</TD><TD ALIGN="LEFT">UserRole</TD></TR>
-                <TR><TD ALIGN="LEFT">invitedById</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">inviteStatus</TD><TD ALIGN="LEFT">InviteStatus</TD></TR>
-                <TR><TD ALIGN="LEFT">joinedAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-            </TABLE>>''',
-
-        'Task': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#F3E5F5">
-                <TR><TD COLSPAN="2" BGCOLOR="#9C27B0"><FONT COLOR="white"><B>Task</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">projectId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">title</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">description</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">priority</TD><TD ALIGN="LEFT">TaskPriority</TD></TR>
-                <TR><TD ALIGN="LEFT">status</TD><TD ALIGN="LEFT">TaskStatus</TD></TR>
-                <TR><TD ALIGN="LEFT">assigneeId</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">ordinal</TD><TD ALIGN="LEFT">Int</TD></TR>
-                <TR><TD ALIGN="LEFT">createdById</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">dueDate</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-                <TR><TD ALIGN="LEFT">isDeleted</TD><TD ALIGN="LEFT">Boolean</TD></TR>
-            </TABLE>>''',
-
-        'TaskHistory': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#EDE7F6">
-                <TR><TD COLSPAN="2" BGCOLOR="#673AB7"><FONT COLOR="white"><B>TaskHistory</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">taskId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">changedById</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">previousStatus</TD><TD ALIGN="LEFT">TaskStatus?</TD></TR>
-                <TR><TD ALIGN="LEFT">newStatus</TD><TD ALIGN="LEFT">TaskStatus?</TD></TR>
-                <TR><TD ALIGN="LEFT">previousAssignee</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">newAssignee</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">comment</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'File': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#E0F7FA">
-                <TR><TD COLSPAN="2" BGCOLOR="#00BCD4"><FONT COLOR="white"><B>File</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">taskId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">uploadedBy</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">filename</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">s3Key</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">sizeBytes</TD><TD ALIGN="LEFT">BigInt</TD></TR>
-                <TR><TD ALIGN="LEFT">mimeType</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'Comment': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#E0F2F1">
-                <TR><TD COLSPAN="2" BGCOLOR="#009688"><FONT COLOR="white"><B>Comment</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">taskId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">authorId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">content</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'ActivityLog': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#ECEFF1">
-                <TR><TD COLSPAN="2" BGCOLOR="#607D8B"><FONT COLOR="white"><B>ActivityLog</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">userId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">action</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">resourceType</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">resourceId</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">details</TD><TD ALIGN="LEFT">Json?</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'Notification': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#FFF8E1">
-                <TR><TD COLSPAN="2" BGCOLOR="#FFC107"><FONT COLOR="black"><B>Notification</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">userId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">type</TD><TD ALIGN="LEFT">NotificationType</TD></TR>
-                <TR><TD ALIGN="LEFT">title</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">message</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">isRead</TD><TD ALIGN="LEFT">Boolean</TD></TR>
-                <TR><TD ALIGN="LEFT">projectId</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">taskId</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">actorId</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">metadata</TD><TD ALIGN="LEFT">Json?</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">readAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-            </TABLE>>''',
-
-        'Course': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#FFEBEE">
-                <TR><TD COLSPAN="2" BGCOLOR="#F44336"><FONT COLOR="white"><B>Course</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">title</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">code</TD><TD ALIGN="LEFT">String (unique)</TD></TR>
-                <TR><TD ALIGN="LEFT">description</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">semester</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">year</TD><TD ALIGN="LEFT">Int</TD></TR>
-                <TR><TD ALIGN="LEFT">professorId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">isActive</TD><TD ALIGN="LEFT">Boolean</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'CourseEnrollment': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#FFCDD2">
-                <TR><TD COLSPAN="2" BGCOLOR="#D32F2F"><FONT COLOR="white"><B>CourseEnrollment</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">courseId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">studentId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">enrolledAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'ProjectGrade': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#C8E6C9">
-                <TR><TD COLSPAN="2" BGCOLOR="#388E3C"><FONT COLOR="white"><B>ProjectGrade</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">projectId</TD><TD ALIGN="LEFT">UUID (FK, unique)</TD></TR>
-                <TR><TD ALIGN="LEFT">professorId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">gradeType</TD><TD ALIGN="LEFT">GradeType</TD></TR>
-                <TR><TD ALIGN="LEFT">numericGrade</TD><TD ALIGN="LEFT">Int?</TD></TR>
-                <TR><TD ALIGN="LEFT">letterGrade</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">feedback</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">gradedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'FinalSubmission': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#DCEDC8">
-                <TR><TD COLSPAN="2" BGCOLOR="#689F38"><FONT COLOR="white"><B>FinalSubmission</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">projectId</TD><TD ALIGN="LEFT">UUID (FK, unique)</TD></TR>
-                <TR><TD ALIGN="LEFT">description</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">status</TD><TD ALIGN="LEFT">SubmissionStatus</TD></TR>
-                <TR><TD ALIGN="LEFT">submittedAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-                <TR><TD ALIGN="LEFT">submittedById</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">reviewedAt</TD><TD ALIGN="LEFT">DateTime?</TD></TR>
-                <TR><TD ALIGN="LEFT">reviewedById</TD><TD ALIGN="LEFT">UUID? (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">reviewComment</TD><TD ALIGN="LEFT">String?</TD></TR>
-            </TABLE>>''',
-
-        'FinalSubmissionFile': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#F0F4C3">
-                <TR><TD COLSPAN="2" BGCOLOR="#AFB42B"><FONT COLOR="white"><B>FinalSubmissionFile</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">submissionId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">filename</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">filepath</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">sizeBytes</TD><TD ALIGN="LEFT">BigInt</TD></TR>
-                <TR><TD ALIGN="LEFT">mimeType</TD><TD ALIGN="LEFT">String?</TD></TR>
-                <TR><TD ALIGN="LEFT">uploadedBy</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'ProjectReview': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#B2DFDB">
-                <TR><TD COLSPAN="2" BGCOLOR="#00796B"><FONT COLOR="white"><B>ProjectReview</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">projectId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">professorId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">content</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-
-        'Announcement': '''<
-            <TABLE BORDER="1" CELLBORDER="0" CELLSPACING="0" BGCOLOR="#B3E5FC">
-                <TR><TD COLSPAN="2" BGCOLOR="#0288D1"><FONT COLOR="white"><B>Announcement</B></FONT></TD></TR>
-                <TR><TD ALIGN="LEFT"><U>id</U></TD><TD ALIGN="LEFT">UUID (PK)</TD></TR>
-                <TR><TD ALIGN="LEFT">courseId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">professorId</TD><TD ALIGN="LEFT">UUID (FK)</TD></TR>
-                <TR><TD ALIGN="LEFT">title</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">content</TD><TD ALIGN="LEFT">String</TD></TR>
-                <TR><TD ALIGN="LEFT">isPinned</TD><TD ALIGN="LEFT">Boolean</TD></TR>
-                <TR><TD ALIGN="LEFT">createdAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-                <TR><TD ALIGN="LEFT">updatedAt</TD><TD ALIGN="LEFT">DateTime</TD></TR>
-            </TABLE>>''',
-    }
+@phases.timed('diagram_source')
+def create_shard_diagram(schema, edges, shards, index):
+    """Lay out one shard; links leaving it end at a stub naming the page of the other model"""
+    shard_of = {name: i for i, shard in enumerate(shards) for name in shard}
+    dot = new_er_graph(f'ER_Shard_{index + 1}', embed_format())
+
+    for name in shards[index]:
+        dot.node(name, label=entity_label(schema.models[name], schema))
+
+    added_edges = set()
+    for rel in edges:
+        ends = (shard_of[rel.parent], shard_of[rel.child])
+        if index not in ends or (rel.parent, rel.child) in added_edges:
+            continue
+        for name, shard in zip((rel.parent, rel.child), ends):
+            if shard != index:
+                # Page 1 is the overview, shard N is on page N + 1
+                dot.node(name, label=f"{name}\n(see page {shard + 2})", shape='box',
+                         style='dashed,rounded', color='#9E9E9E', fontcolor='#616161')
+        dot.edge(rel.parent, rel.child, label=rel.cardinality,
+                 arrowhead='none' if rel.cardinality == '1:1' else 'crow')
+        added_edges.add((rel.parent, rel.child))
+
+    return render_diagram(dot, f'er_diagram_shard_{index + 1}')
+
+
+@phases.timed('diagram_source')
+def create_overview_diagram(shards, edges):
+    """One node per shard, with the number of links between shards"""
+    dot = Digraph('ER_Overview', format=embed_format())
+    dot.attr(rankdir='LR', splines='spline', nodesep='0.6', ranksep='1.2')
+    dot.attr('node', shape='box', style='filled,rounded', fillcolor='#E3F2FD',
+             fontname='Arial', fontsize='11')
+    dot.attr('edge', fontname='Arial', fontsize='9', color='#666666', dir='none')
+
+    for i, shard in enumerate(shards):
+        names = ', '.join(shard[:4]) + (', ...' if len(shard) > 4 else '')
+        dot.node(f'shard{i}', f"Page {i + 2}: {len(shard)} models\n{names}")
+    for (a, b), count in sorted(cross_links(shards, edges).items()):
+        dot.edge(f'shard{a}', f'shard{b}', label=str(count), penwidth=str(min(1 + count / 4, 6)))
+
+    return render_diagram(dot, 'er_diagram_overview')
+
+
+@phases.timed('flowables')
+def create_sharded_er_pdf(schema):
+    """Paginated ER document: an overview page, then one page per shard"""
+    edges = relations(schema)
+    shards = shard_models(list(schema.models), edges)
+
+    # Each shard is an independent `dot` run, so they are laid out in parallel
+    with ThreadPoolExecutor(max_workers=min(len(shards), os.cpu_count() or 1) + 1) as pool:
+        overview = pool.submit(create_overview_diagram, shards, edges)
+        diagrams = list(pool.map(lambda i: create_shard_diagram(schema, edges, shards, i),
+                                 range(len(shards))))
+        overview = overview.result()
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=landscape(A3), rightMargin=1*cm, leftMargin=1*cm,
+                            topMargin=1*cm, bottomMargin=1*cm, pageCompression=draft.page_compression())
+    phases.switch('styles')
+    styles = fonts.sample_styles()
+    # Leave room for the page heading above each diagram
+    box = (doc.width, doc.height - 2*cm)
+
+    phases.switch('flowables')
+    content = [Paragraph("Project Management System - Entity-Relationship Diagram", styles['Heading1']),
+               diagram_flowable(overview, *box)]
+    for i, (shard, diagram) in enumerate(zip(shards, diagrams)):
+        content.append(PageBreak())
+        content.append(Paragraph(f"Shard {i + 1} of {len(shards)}", styles['Heading2']))
+        content.append(diagram_flowable(diagram, *box))
+    phases.switch('build')
+    doc.build(content)
+    path = output.publish(OUTPUT, buffer.getvalue())
+
+    discard(overview, *diagrams)
+    print(f"ER Diagram generated successfully: {path} ({len(shards)} shards)")
+    return path
+
+
+@phases.timed('flowables')
+def create_draft_er_pdf(dot):
+    """Draft of the single-page ER document without a Graphviz layout
+
+    Reuses the last render of the diagram (exact when the schema is unchanged),
+    else stands in a placeholder page.
+    """
+    name = os.path.splitext(OUTPUT)[0]
+    cached = draft_render(dot, name).getvalue()
+    if cached:
+        path = output.publish(OUTPUT, cached)
+        print(f"ER Diagram draft generated: {path} (last render, may predate schema changes)")
+        return path
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=landscape(A3), rightMargin=1*cm, leftMargin=1*cm,
+                            topMargin=1*cm, bottomMargin=1*cm, pageCompression=draft.page_compression())
+    styles = fonts.sample_styles()
+    doc.build([Paragraph("Project Management System - Entity-Relationship Diagram", styles['Heading1']),
+               draft.Placeholder(name, doc.width, doc.height - 2*cm)])
+    path = output.publish(OUTPUT, buffer.getvalue())
+    print(f"ER Diagram draft generated: {path} (never rendered, placeholder)")
+    return path
+
+
+@phases.timed('diagram_source')
+def create_er_diagram(sharded=None):
+    schema = load_schema()
+    if sharded is None:
+        layout = os.environ.get('DOCS_ER_LAYOUT', 'auto')
+        sharded = layout == 'sharded' or (layout == 'auto' and len(schema.models) > SHARD_THRESHOLD)
+    if sharded:
+        return create_sharded_er_pdf(schema)
+
+    # Create a new directed graph with specific settings for ER diagrams
+    dot = new_er_graph('ER_Diagram', 'pdf')
 
     # Add all entity nodes
-    for entity_name, label in entities.items():
-        dot.node(entity_name, label=label)
-
-    # Define relationships with cardinality labels
-    relationships = [
-        # User relationships
-        ('User', 'Session', '1', 'N', 'has'),
-        ('User', 'Project', '1', 'N', 'leads'),
-        ('User', 'ProjectUser', '1', 'N', 'member'),
-        ('User', 'ProjectUser', '1', 'N', 'invites'),
-        ('User', 'Task', '1', 'N', 'assigned'),
-        ('User', 'Task', '1', 'N', 'creates'),
-        ('User', 'TaskHistory', '1', 'N', 'changes'),
-        ('User', 'File', '1', 'N', 'uploads'),
-        ('User', 'Comment', '1', 'N', 'authors'),
-        ('User', 'ActivityLog', '1', 'N', 'logs'),
-        ('User', 'Notification', '1', 'N', 'receives'),
-        ('User', 'Course', '1', 'N', 'teaches'),
-        ('User', 'CourseEnrollment', '1', 'N', 'enrolls'),
-        ('User', 'ProjectGrade', '1', 'N', 'grades'),
-        ('User', 'FinalSubmission', '1', 'N', 'submits'),
-        ('User', 'FinalSubmission', '1', 'N', 'reviews'),
-        ('User', 'ProjectReview', '1', 'N', 'writes'),
-        ('User', 'Announcement', '1', 'N', 'posts'),
-        ('User', 'FinalSubmissionFile', '1', 'N', 'uploads'),
-
-        # Project relationships
-        ('Project', 'ProjectUser', '1', 'N', 'has'),
-        ('Project', 'Task', '1', 'N', 'contains'),
-        ('Project', 'Notification', '1', 'N', 'triggers'),
-        ('Project', 'ProjectGrade', '1', '1', 'graded'),
-        ('Project', 'FinalSubmission', '1', '1', 'submission'),
-        ('Project', 'ProjectReview', '1', 'N', 'reviewed'),
-
-        # Course relationships
-        ('Course', 'Project', '1', 'N', 'has'),
-        ('Course', 'CourseEnrollment', '1', 'N', 'enrollments'),
-        ('Course', 'Announcement', '1', 'N', 'announcements'),
-
-        # Task relationships
-        ('Task', 'TaskHistory', '1', 'N', 'history'),
-        ('Task', 'File', '1', 'N', 'attachments'),
-        ('Task', 'Comment', '1', 'N', 'comments'),
-        ('Task', 'Notification', '1', 'N', 'notifications'),
-
-        # FinalSubmission relationships
-        ('FinalSubmission', 'FinalSubmissionFile', '1', 'N', 'files'),
-    ]
-
-    # Add edges with relationship labels
+    for model in schema.models.values():
+        dot.node(model.name, label=entity_label(model, schema))
+
+    # Add edges with relationship labels (one edge per pair of entities)
     added_edges = set()
-    for rel in relationships:
-        edge_key = (rel[0], rel[1])
+    for rel in relations(schema):
+        edge_key = (rel.parent, rel.child)
         if edge_key not in added_edges:
-            label = f"{rel[2]}:{rel[3]}"
-            dot.edge(rel[0], rel[1], label=label, arrowhead='none' if rel[3] == '1' else 'crow')
+            dot.edge(rel.parent, rel.child, label=rel.cardinality,
+                     arrowhead='none' if rel.cardinality == '1:1' else 'crow')
             added_edges.add(edge_key)
 
     # Add legend
@@ -333,10 +239,14 @@ def create_er_diagram():
         </TABLE>>'''
     dot.node('Title', label=title, shape='none')
 
+    if draft.enabled():
+        return create_draft_er_pdf(dot)
+
     # Render the diagram
-    output_path = dot.render('er_diagram', cleanup=True)
-    print(f"ER Diagram generated successfully: {output_path}")
-    return output_path
+    path = render(dot, output.path(os.path.splitext(OUTPUT)[0]))
+    print(f"ER Diagram generated successfully: {path}")
+    return path
+
 
 if __name__ == '__main__':
     create_er_diagram()
@@ -39,7 +39,7 @@ const config = {
   },
 
   // Coverage reporters
-  coverageReporters: ['text', 'text-summary', 'html', 'lcov'],
+  coverageReporters: ['text', 'text-summary', 'html', 'lcov', 'json-summary'],
 
   // Coverage directory
   coverageDirectory: 'coverage',
@@ -0,0 +1,11 @@
+"""
+Shared setup for the docgen tests: the generators and docgen are imported from the repository root
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
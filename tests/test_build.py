@@ -0,0 +1,38 @@
+"""
+Tests for docgen/build.py target discovery
+"""
+
+import importlib
+import inspect
+
+import pytest
+
+from conftest import ROOT
+from docgen import build, document
+
+GENERATORS = [target.module for target in build.discover(ROOT)]
+
+
+def _blocks(module):
+    if hasattr(module, 'DOCUMENT'):
+        return module.DOCUMENT
+    if hasattr(module, 'blocks') and not inspect.signature(module.blocks).parameters:
+        return module.blocks()
+    return []
+
+
+@pytest.mark.parametrize('module', GENERATORS)
+def test_code_block_sources_are_inputs(module, monkeypatch):
+    """Every file a 'code' block shows is an input, so editing it rebuilds the document"""
+    monkeypatch.chdir(ROOT)
+    target = next(t for t in build.discover() if t.module == module)
+    missing = set(document.code_paths(_blocks(importlib.import_module(module)))) - set(target.inputs)
+    assert not missing, f"{module}: 'code' blocks that docgen/build.py cannot resolve: {sorted(missing)}"
+
+
+def test_docgen_modules_imported_indirectly_are_inputs(monkeypatch):
+    """docgen/fonts.py reaches the design patterns document only through docgen/document.py"""
+    monkeypatch.chdir(ROOT)
+    target = next(t for t in build.discover() if t.module == 'generate_design_patterns_pdf')
+    assert 'docgen/document.py' in target.inputs
+    assert 'docgen/fonts.py' in target.inputs
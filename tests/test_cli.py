@@ -0,0 +1,20 @@
+"""
+Tests for docgen/cli.py
+"""
+
+import os
+import subprocess
+import sys
+
+from conftest import ROOT
+
+
+def test_clean_does_not_load_reportlab(tmp_path):
+    (tmp_path / 'handbook.pdf').write_bytes(b'%PDF')
+    code = ("import sys\n"
+            "from docgen import cli\n"
+            "cli.main(['clean'])\n"
+            "assert 'reportlab' not in sys.modules and 'graphviz' not in sys.modules, 'heavy import'\n")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    subprocess.run([sys.executable, '-c', code], cwd=tmp_path, env=env, check=True, capture_output=True)
+    assert not (tmp_path / 'handbook.pdf').exists()
@@ -0,0 +1,26 @@
+"""
+Tests for docgen/coverage_report.py
+"""
+
+import pytest
+
+from docgen import coverage_report
+
+
+def test_missing_report_names_the_files_and_the_command(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(coverage_report.CoverageNotFound) as raised:
+        coverage_report.read_coverage()
+    message = str(raised.value)
+    assert 'coverage/coverage-summary.json' in message and 'coverage/lcov.info' in message
+    assert 'npm run test:coverage' in message
+
+
+def test_lcov_report_is_found(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'coverage').mkdir()
+    (tmp_path / 'coverage' / 'lcov.info').write_text(
+        'SF:src/lib/a.ts\nLF:4\nLH:3\nend_of_record\n', encoding='utf-8')
+    report = coverage_report.read_coverage()
+    assert report.source == 'coverage/lcov.info'
+    assert report.totals == {'lines': (3, 4)}
@@ -0,0 +1,27 @@
+"""
+Tests that documents use the registered fonts (docgen/fonts.py) throughout
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+BASE_14 = re.compile(rb'/BaseFont /(Helvetica|Courier|Times|Symbol|ZapfDingbats)[\w-]*')
+
+
+@pytest.mark.parametrize('module, output', [
+    ('generate_testing_pdf', 'unit_testing_coverage.pdf'),
+    ('generate_tests_documentation', 'tests_documentation.pdf'),
+])
+def test_fresh_process_embeds_no_base14_fonts(module, output, tmp_path):
+    """The fonts must not depend on another document having registered them first in the process"""
+    env = dict(os.environ, DOCS_DRAFT='1', DOCS_OUTPUT_DIR=str(tmp_path), DOCS_CACHE_DIR=str(tmp_path / 'cache'))
+    env.pop('DOCS_FONTS', None)
+    subprocess.run([sys.executable, f'{module}.py'], cwd=ROOT, env=env, check=True, capture_output=True)
+    data = (tmp_path / output).read_bytes()
+    assert not BASE_14.findall(data)
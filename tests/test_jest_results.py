@@ -0,0 +1,48 @@
+"""
+Tests for docgen/jest_results.py
+"""
+
+import pytest
+
+from docgen import jest_results
+
+
+def test_missing_results_name_the_files_and_the_command(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(jest_results.ResultsNotFound) as raised:
+        jest_results.summarize(jest_results.results_path())
+    message = str(raised.value)
+    assert 'jest-results.json' in message and 'test_output.txt' in message
+    assert 'npm' in message
+
+
+def test_iter_results_without_a_run(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(FileNotFoundError):
+        list(jest_results.iter_results())
+
+
+def test_console_log_is_found(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'test_output.txt').write_text(
+        'PASS src/__tests__/a.test.ts\n  a\n    √ works (3 ms)\n\n'
+        'Tests:       1 passed, 1 total\n', encoding='utf-8')
+    assert jest_results.results_path() == 'test_output.txt'
+    assert jest_results.summarize().tests == {'passed': 1, 'total': 1}
+
+
+def test_test_names_with_a_pipe_are_kept(tmp_path):
+    log = tmp_path / 'test_output.txt'
+    log.write_text(
+        'PASS src/__tests__/a.test.ts\n'
+        '  parse\n'
+        "    √ a | b (2 ms)\n"
+        '    √ plain (1 ms)\n'
+        '\n'
+        '----------|---------|----------|---------|---------|-------------------\n'
+        'File      | % Stmts | % Branch | % Funcs | % Lines | Uncovered Line #s\n'
+        '----------|---------|----------|---------|---------|-------------------\n'
+        'All files |     100 |      100 |     100 |     100 |\n'
+        '----------|---------|----------|---------|---------|-------------------\n', encoding='utf-8')
+    names = [result.name for result in jest_results.iter_results(str(log))]
+    assert names == ['parse › a | b', 'parse › plain']
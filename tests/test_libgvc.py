@@ -0,0 +1,60 @@
+"""
+Tests for docgen/libgvc.py and the choice between it and the `dot` binary in docgen/render.py
+"""
+
+import subprocess
+
+import pytest
+
+from docgen import libgvc, render, toolchain
+
+
+def graph(splines=None):
+    attrs = f'\tgraph [splines={splines}]\n' if splines else ''
+    return f'digraph g {{\n{attrs}\ta -> b\n\ta -> c\n}}\n'
+
+
+SOURCE = graph('line')
+
+
+@pytest.fixture
+def library(monkeypatch):
+    """Pretend a libgvc matching `dot` is installed"""
+    monkeypatch.setattr(render, 'graphviz_version', lambda: '2.43.0')
+    monkeypatch.setattr(libgvc, 'available', lambda expected_version: True)
+
+
+@pytest.mark.parametrize('splines', [None, 'spline', 'ortho'])
+def test_budgeted_spline_layouts_stay_killable(library, monkeypatch, splines):
+    monkeypatch.setattr(render, 'BACKEND', 'auto')
+    source = graph(splines)
+    assert not render._use_library(source, budget=60)
+    # Without a budget there is nothing for a process to enforce
+    assert render._use_library(source, budget=0)
+
+
+def test_cheap_layouts_run_in_process(library, monkeypatch):
+    monkeypatch.setattr(render, 'BACKEND', 'auto')
+    assert render._use_library(SOURCE, budget=60)
+    assert not render._use_library(SOURCE + ' ' * render.LIBRARY_MAX_BYTES, budget=60)
+
+
+def test_forced_backends(library, monkeypatch):
+    ortho = graph('ortho')
+    monkeypatch.setattr(render, 'BACKEND', 'library')
+    assert render._use_library(ortho, budget=60)
+    monkeypatch.setattr(render, 'BACKEND', 'subprocess')
+    assert not render._use_library(SOURCE, budget=0)
+
+
+def test_library_renders_what_dot_renders():
+    try:
+        dot = toolchain.dot_path()
+    except toolchain.GraphvizNotFound:
+        pytest.skip('Graphviz is not installed')
+    version = subprocess.run([dot, '-V'], capture_output=True, text=True).stderr.split()
+    library = libgvc.version()
+    if library is None or library not in version:
+        pytest.skip('libgvc matching `dot` is not installed')
+    expected = subprocess.run([dot, '-Tsvg'], input=SOURCE.encode(), capture_output=True, check=True).stdout
+    assert libgvc.render(SOURCE, 'svg') == expected
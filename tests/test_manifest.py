@@ -0,0 +1,27 @@
+"""
+Tests for docgen/manifest.py
+"""
+
+from docgen import manifest
+
+
+def _built(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'input.txt').write_text('content', encoding='utf-8')
+    (tmp_path / 'doc.pdf').write_bytes(b'%PDF')
+    state = manifest.snapshot(['input.txt'])
+    manifest.save('doc.pdf', state)
+    return manifest.load('doc.pdf')
+
+
+def test_unchanged_inputs_and_settings_are_fresh(tmp_path, monkeypatch):
+    previous = _built(tmp_path, monkeypatch)
+    assert not manifest.is_stale('doc.pdf', manifest.snapshot(['input.txt'], previous), previous)
+
+
+def test_changed_setting_is_stale(tmp_path, monkeypatch):
+    monkeypatch.delenv('DOCS_DIAGRAM_MODE', raising=False)
+    previous = _built(tmp_path, monkeypatch)
+    # build_docs.py --raster
+    monkeypatch.setenv('DOCS_DIAGRAM_MODE', 'raster')
+    assert manifest.is_stale('doc.pdf', manifest.snapshot(['input.txt'], previous), previous)
@@ -0,0 +1,63 @@
+"""
+Tests for docgen/render.py layout fallbacks
+"""
+
+from docgen import render
+
+
+def _timing_out(monkeypatch, tmp_path):
+    """Make every layout attempt time out, recording the program and splines of each"""
+    tried = []
+
+    def run(cmd, data, budget):
+        splines = next((arg.split('=', 1)[1] for arg in cmd if arg.startswith('-Gsplines=')), None)
+        tried.append((cmd[0], splines))
+        raise render.LayoutTimeout('over budget')
+
+    monkeypatch.setattr(render, 'BACKEND', 'subprocess')
+    monkeypatch.setattr(render, 'LAYOUT_LOG', str(tmp_path / 'layouts.log'))
+    monkeypatch.setattr(render, '_run', run)
+    return tried
+
+
+def test_fallback_matching_the_graphs_splines_is_skipped(monkeypatch, tmp_path):
+    tried = _timing_out(monkeypatch, tmp_path)
+    source = 'digraph g {\n\tgraph [splines=polyline]\n\ta -> b\n}\n'
+    try:
+        render.layout(source, 'svg', budget=1)
+    except render.LayoutTimeout:
+        pass
+    # No second polyline run; the unflatten pass times out before its `dot` run
+    assert tried == [('dot', None), ('dot', 'line'), ('unflatten', None), ('sfdp', 'line')]
+
+
+def test_every_fallback_runs_for_spline_graphs(monkeypatch, tmp_path):
+    tried = _timing_out(monkeypatch, tmp_path)
+    source = 'digraph g {\n\tgraph [splines=ortho]\n\ta -> b\n}\n'
+    try:
+        render.layout(source, 'svg', budget=1)
+    except render.LayoutTimeout:
+        pass
+    assert tried == [('dot', None), ('dot', 'polyline'), ('dot', 'line'), ('unflatten', None), ('sfdp', 'line')]
+
+
+def test_entry_evicted_during_a_cache_hit_is_rendered_again(monkeypatch, tmp_path):
+    monkeypatch.setattr(render, 'CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(render, 'graphviz_version', lambda: '2.43.0')
+    monkeypatch.setattr(render, 'layout', lambda source, fmt, **kwargs: b'<svg/>')
+
+    class Dot:
+        source, format, engine, name = 'digraph g {}', 'svg', 'dot', 'g'
+
+    entry = tmp_path / f"{render.cache_key(Dot.source, Dot.format)}.svg"
+    entry.write_bytes(b'<svg/>')
+    utime = render.os.utime
+
+    def evicted(path, *args):
+        # Another build's evict() removes the entry right after it was found
+        if path == str(entry) and entry.exists():
+            entry.unlink()
+        return utime(path, *args)
+
+    monkeypatch.setattr(render.os, 'utime', evicted)
+    assert render.render_bytes(Dot) == b'<svg/>'